@@ -1,22 +1,41 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
 
 block_cipher = None
 
+# DLLs UPX cannot shrink (already compressed, or broken by packing);
+# BUILD_FAST=1 skips UPX altogether for quick development builds
+UPX_EXCLUDE = [
+    'vcruntime140.dll',
+    'vcruntime140_1.dll',
+    'python3.dll',
+    'python%d%d.dll' % sys.version_info[:2],
+    'tcl86t.dll',
+    'tk86t.dll',
+]
+
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[
-        ('algorithms', 'algorithms'),
-        ('ui', 'ui'),
-        ('config.py', '.'),
-    ],
+    # algorithms/, ui/ and config.py are found by import analysis; bundling
+    # them again as data only adds files to classify and copy
+    datas=[],
     hiddenimports=[
         'tkinter',
         'tkinter.ttk',
         'tkinter.scrolledtext',
         'tkinter.filedialog',
         'tkinter.messagebox',
+        # main.py imports these lazily by name
+        'algorithms.fasta_parser',
+        'algorithms.dna_operations',
+        'algorithms.pattern_matching',
+        'algorithms.index_search',
+        'algorithms.suffix_array',
+        'algorithms.assembly',
+        'algorithms.edit_distance',
     ],
     hookspath=[],
     hooksconfig={},
@@ -30,6 +49,14 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# Resolve the icon with a single stat when the spec is loaded (any
+# existing file counts, as with os.path.exists)
+try:
+    os.stat('assets/icon.ico')
+    _ICON = 'assets/icon.ico'
+except OSError:
+    _ICON = None
+
 exe = EXE(
     pyz,
     a.scripts,
@@ -41,8 +68,8 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
+    upx=not os.environ.get('BUILD_FAST'),
+    upx_exclude=UPX_EXCLUDE,
     runtime_tmpdir=None,
     console=False,  # No console window
     disable_windowed_traceback=False,
@@ -50,5 +77,5 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    icon='assets/icon.ico' if os.path.exists('assets/icon.ico') else None,
+    icon=_ICON,
 )
@@ -1,11 +1,33 @@
 """
 Algorithms Package
 All bioinformatics algorithms
+
+Submodules are imported on first use rather than with the package, so
+importing one of them does not load the others (or numpy) as well
 """
 
-from .fasta_parser import *
-from .dna_operations import *
-from .pattern_matching import *
-from .index_search import *
-from .suffix_array import *
-from .assembly import *
\ No newline at end of file
+import importlib
+
+_SUBMODULES = (
+    'fasta_parser',
+    'dna_operations',
+    'pattern_matching',
+    'index_search',
+    'suffix_array',
+    'assembly',
+)
+
+
+def __getattr__(name):
+    """Resolve `algorithms.<name>` from the submodules on first access"""
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if not name.startswith('_'):
+        # Later submodules win, as with the star imports this replaces
+        for sub in reversed(_SUBMODULES):
+            module = importlib.import_module(f'.{sub}', __name__)
+            if hasattr(module, name):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
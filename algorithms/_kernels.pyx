@@ -0,0 +1,78 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled kernels for edit distance and Boyer-Moore over ASCII bytes
+Optional: build with `python build_kernels.py`; the algorithms modules fall
+back to their Python implementations when this extension is missing
+"""
+
+from libc.stdlib cimport malloc, free
+
+
+cdef Py_ssize_t _edit_distance(const unsigned char* a, Py_ssize_t la,
+                               const unsigned char* b, Py_ssize_t lb,
+                               Py_ssize_t* prev, Py_ssize_t* curr) nogil:
+    """Two-row edit distance DP (rows run along b)"""
+    cdef Py_ssize_t i, j, best, cost
+    cdef Py_ssize_t* tmp
+    for j in range(lb + 1):
+        prev[j] = j
+    for i in range(1, la + 1):
+        curr[0] = i
+        for j in range(1, lb + 1):
+            best = prev[j - 1] + (a[i - 1] != b[j - 1])   # Substitution (or match)
+            cost = prev[j] + 1                            # Deletion
+            if cost < best:
+                best = cost
+            cost = curr[j - 1] + 1                        # Insertion
+            if cost < best:
+                best = cost
+            curr[j] = best
+        tmp = prev
+        prev = curr
+        curr = tmp
+    return prev[lb]
+
+
+def edit_distance(bytes x, bytes y):
+    """Edit distance between two byte strings"""
+    if len(y) > len(x):
+        x, y = y, x
+    cdef const unsigned char* a = x
+    cdef const unsigned char* b = y
+    cdef Py_ssize_t la = len(x), lb = len(y), result
+    cdef Py_ssize_t* rows = <Py_ssize_t*> malloc(2 * (lb + 1) * sizeof(Py_ssize_t))
+    if rows == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            result = _edit_distance(a, la, b, lb, rows, rows + lb + 1)
+    finally:
+        free(rows)
+    return result
+
+
+def boyer_moore(bytes text, bytes pattern):
+    """Match positions of pattern in text (bad character rule)"""
+    cdef const unsigned char* t = text
+    cdef const unsigned char* p = pattern
+    cdef Py_ssize_t n = len(text), m = len(pattern), i = 0, j, shift
+    cdef Py_ssize_t last[256]
+    positions = []
+
+    for j in range(256):
+        last[j] = -1
+    for j in range(m):
+        last[p[j]] = j
+
+    while i <= n - m:
+        j = m - 1
+        while j >= 0 and p[j] == t[i + j]:
+            j -= 1
+        if j < 0:
+            positions.append(i)
+            i += 1
+        else:
+            shift = j - last[t[i + j]]
+            i += shift if shift > 1 else 1
+
+    return positions
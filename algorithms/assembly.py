@@ -3,7 +3,18 @@ Sequence Assembly Module
 Contains functions for finding overlaps and assembling sequences
 """
 
-from itertools import permutations
+import multiprocessing
+from collections import defaultdict
+
+# Below this many reads the plain all-pairs scan is cheaper than indexing
+INDEX_MIN_READS = 32
+
+# From this many reads the per-read overlap search is spread over a process
+# pool; below it, pool start-up costs more than it saves
+PARALLEL_MIN_READS = 1000
+
+# (reads, k, prefix_index, short_reads) shared with pool workers
+_worker_state = None
 
 
 def find_overlap(a, b, min_length=3):
@@ -18,13 +29,20 @@ def find_overlap(a, b, min_length=3):
     Returns:
         Length of overlap (0 if no overlap found)
     """
-    start = 0
+    return _find_overlap_pre(a, b, b[:min_length])
+
+
+def _find_overlap_pre(a, b, prefix):
+    """find_overlap with b's min_length prefix already sliced by the caller"""
+    len_a = len(a)
+    # a[start:] must fit inside b, so earlier starts can never match
+    start = max(0, len_a - len(b))
     while True:
-        start = a.find(b[:min_length], start)
+        start = a.find(prefix, start)
         if start == -1:
             return 0
         if b.startswith(a[start:]):
-            return len(a) - start
+            return len_a - start
         start += 1
 
 
@@ -39,42 +57,144 @@ def find_all_overlaps(reads, k):
     Returns:
         Dictionary mapping sequence pairs (a, b) to overlap lengths
     """
+    return {(reads[i], reads[j]): olen
+            for (i, j), olen in find_all_overlaps_indexed(reads, k).items()}
+
+
+def find_all_overlaps_indexed(reads, k):
+    """
+    Find all overlaps between sequences, keyed by read index
+    
+    Avoids hashing whole sequences as dictionary keys; pass the reads to
+    format_overlap_table to resolve the indices for display.
+    
+    Args:
+        reads: List of sequences (strings)
+        k: Minimum overlap length (minlength)
+    
+    Returns:
+        Dictionary mapping index pairs (i, j) to overlap lengths
+    """
+    n = len(reads)
+    if n < INDEX_MIN_READS:
+        prefixes = [r[:k] for r in reads]
+        overlaps = {}
+        for i in range(n):
+            a = reads[i]
+            for j in range(n):
+                if i != j:
+                    overlap_length = _find_overlap_pre(a, reads[j], prefixes[j])
+                    if overlap_length > 0:
+                        overlaps[(i, j)] = overlap_length
+        return overlaps
+
+    # Index reads by their length-k prefix so each read is only verified
+    # against reads whose prefix actually occurs in it
+    prefix_index = defaultdict(list)
+    short_reads = []
+    for j, b in enumerate(reads):
+        if len(b) < k:
+            short_reads.append(j)
+        else:
+            prefix_index[b[:k]].append(j)
+    state = (reads, k, dict(prefix_index), short_reads)
+
+    if n >= PARALLEL_MIN_READS:
+        # Spawned, not forked: this runs on a worker thread of the Tk app,
+        # and forking a multi-threaded process (with an open X connection)
+        # can deadlock; the frozen Windows build spawns anyway
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(initializer=_init_worker, initargs=(state,)) as pool:
+            results = pool.map(_pool_overlaps_from, range(n))
+    else:
+        results = [_overlaps_from(i, *state) for i in range(n)]
+
     overlaps = {}
-    for a, b in permutations(reads, 2):
-        overlap_length = find_overlap(a, b, k)
-        if overlap_length > 0:
-            overlaps[(a, b)] = overlap_length
+    for i, found in enumerate(results):
+        for j, overlap_length in found:
+            overlaps[(i, j)] = overlap_length
     return overlaps
 
 
+def _overlaps_from(i, reads, k, prefix_index, short_reads):
+    """Return sorted (j, overlap_length) pairs for every read j that reads[i] overlaps"""
+    a = reads[i]
+    found = {}
+    for p in range(len(a) - k + 1):
+        candidates = prefix_index.get(a[p:p+k])
+        if not candidates:
+            continue
+        suffix = None
+        for j in candidates:
+            if j == i or j in found:
+                continue
+            if suffix is None:
+                suffix = a[p:]
+            # Earliest start wins, matching find_overlap
+            if reads[j].startswith(suffix):
+                found[j] = len(a) - p
+    for j in short_reads:
+        if j != i:
+            overlap_length = find_overlap(a, reads[j], k)
+            if overlap_length > 0:
+                found[j] = overlap_length
+    return [(j, found[j]) for j in sorted(found) if found[j] > 0]
+
+
+def _init_worker(state):
+    """Pool initializer: receive the shared reads/index once per worker"""
+    global _worker_state
+    _worker_state = state
+
+
+def _pool_overlaps_from(i):
+    """Pool worker: overlaps of reads[i] using the state from _init_worker"""
+    return _overlaps_from(i, *_worker_state)
+
+
 def format_overlap_table(overlaps, reads=None):
     """
     Format overlap results as a table
     
     Args:
         overlaps: Dictionary of overlap pairs to lengths
-        reads: Optional list of original sequences for index lookup
+        reads: Optional list of original sequences; when given, the
+               overlap keys are (i, j) index pairs into it
     
     Returns:
         Formatted string table
     """
+    return "".join(iter_overlap_table(overlaps, reads))
+
+
+def iter_overlap_table(overlaps, reads=None):
+    """
+    Yield the lines of format_overlap_table one at a time
+    
+    Args:
+        overlaps: Dictionary of overlap pairs to lengths
+        reads: Optional list of original sequences (see format_overlap_table)
+    
+    Yields:
+        Table lines, each ending in a newline
+    """
     if not overlaps:
-        return "No overlaps found.\n"
+        yield "No overlaps found.\n"
+        return
 
-    result = ""
-    result += f"{'Seq A':30s} {'Seq B':30s} {'Overlap':10s}\n"
-    result += "-" * 80 + "\n"
+    yield f"{'Seq A':30s} {'Seq B':30s} {'Overlap':10s}\n"
+    yield "-" * 80 + "\n"
 
     # Sort by overlap length (descending)
     sorted_overlaps = sorted(overlaps.items(), key=lambda x: x[1], reverse=True)
 
     for (seq_a, seq_b), olen in sorted_overlaps:
+        if reads is not None:
+            seq_a, seq_b = reads[seq_a], reads[seq_b]
         # Truncate sequences if too long
         a_display = seq_a if len(seq_a) <= 25 else seq_a[:22] + "..."
         b_display = seq_b if len(seq_b) <= 25 else seq_b[:22] + "..."
-        result += f"{a_display:30s} {b_display:30s} {olen:<10d}\n"
-
-    return result
+        yield f"{a_display:30s} {b_display:30s} {olen:<10d}\n"
 
 
 def visualize_overlap(seq_a, seq_b, overlap_len):
@@ -94,12 +214,11 @@ def visualize_overlap(seq_a, seq_b, overlap_len):
 
     start = len(seq_a) - overlap_len
 
-    out = ""
-    out += f"Sequence A: {seq_a}\n"
-    out += " " * 12 + " " * start + "↓" * overlap_len + "\n"
-    out += f"Sequence B: {' ' * start}{seq_b}\n"
-    out += f"\nOverlap Region: {seq_a[start:]}\n"
-    return out
+    out = [f"Sequence A: {seq_a}\n",
+           " " * 12 + " " * start + "↓" * overlap_len + "\n",
+           f"Sequence B: {' ' * start}{seq_b}\n",
+           f"\nOverlap Region: {seq_a[start:]}\n"]
+    return "".join(out)
 
 
 def get_overlap_stats(overlaps, sequences):
@@ -131,13 +250,14 @@ def get_overlap_stats(overlaps, sequences):
     }
 
 
-def greedy_assembly(reads, k):
+def greedy_assembly(reads, k, record_steps=True):
     """
     Perform greedy sequence assembly
     
     Args:
         reads: List of sequences to assemble
         k: Minimum overlap length
+        record_steps: If False, skip the per-step contig snapshots
     
     Returns:
         Tuple of (final_contig, assembly_steps)
@@ -146,9 +266,17 @@ def greedy_assembly(reads, k):
         return "", []
 
     sequences = reads.copy()
-    contig = sequences.pop(0)
+    # Contig pieces are joined once at the end instead of re-copying
+    # the whole contig on every merge
+    parts = [sequences.pop(0)]
+    prefixes = [s[:k] for s in sequences]
     steps = []
 
+    # An overlap can never be longer than the read being placed, so only
+    # the last max_read_len characters of the contig need to be searched
+    max_read_len = max(map(len, sequences), default=0)
+    tail = parts[0][max(0, len(parts[0]) - max_read_len):]
+
     while sequences:
         best_olen = 0
         best_index = None
@@ -156,7 +284,7 @@ def greedy_assembly(reads, k):
 
         # Find best overlap
         for idx, seq in enumerate(sequences):
-            olen = find_overlap(contig, seq, k)
+            olen = _find_overlap_pre(tail, seq, prefixes[idx])
             if olen > best_olen:
                 best_olen = olen
                 best_index = idx
@@ -164,37 +292,30 @@ def greedy_assembly(reads, k):
 
         if best_seq is None:
             # No overlap found → append remaining sequences
-            for seq in sequences:
-                contig += seq
+            parts.extend(sequences)
             break
 
         # Merge sequences
-        new_contig = contig + best_seq[best_olen:]
+        piece = best_seq[best_olen:]
+        parts.append(piece)
+        tail += piece
+        tail = tail[max(0, len(tail) - max_read_len):]
 
         # Record step
-        steps.append({
-            "seq1_idx": -1,
-            "seq2_idx": best_index,
-            "overlap": best_olen,
-            "result": new_contig
-        })
-
-        contig = new_contig
+        if record_steps:
+            steps.append({
+                "seq1_idx": -1,
+                "seq2_idx": best_index,
+                "overlap": best_olen,
+                "result": "".join(parts)
+            })
+
         sequences.pop(best_index)
+        prefixes.pop(best_index)
 
-    return contig, steps
+    return "".join(parts), steps
 
 
-def native_overlap(reads, k):
-    """
-    Original implementation - wrapper for find_all_overlaps
-    Returns dictionary with overlap information
-    
-    Args:
-        reads: List of sequences
-        k: Minimum overlap length
-    
-    Returns:
-        Dictionary mapping sequence pairs to overlap lengths
-    """
-    return find_all_overlaps(reads, k)
\ No newline at end of file
+# Original name for find_all_overlaps, kept as an alias so there is a
+# single implementation to maintain
+native_overlap = find_all_overlaps
@@ -1,17 +1,84 @@
 """
 DNA Operations Module
 GC Content, Complement, Reverse, Translation
+Sequences may be str or ASCII bytes; bytes skip the encode step of the
+numpy paths
 """
 
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - fall back to str.count
+    np = None
+
+# Base-pairing table for str.translate (runs the substitution in C)
+_COMP_TABLE = str.maketrans("ACGT", "TGCA")
+_COMP_BYTES = bytes.maketrans(b"ACGT", b"TGCA")
+
+_CODON_TABLE = MappingProxyType({
+    "TTT": "F", "CTT": "L", "ATT": "I", "GTT": "V",
+    "TTC": "F", "CTC": "L", "ATC": "I", "GTC": "V",
+    "TTA": "L", "CTA": "L", "ATA": "I", "GTA": "V",
+    "TTG": "L", "CTG": "L", "ATG": "M", "GTG": "V",
+    "TCT": "S", "CCT": "P", "ACT": "T", "GCT": "A",
+    "TCC": "S", "CCC": "P", "ACC": "T", "GCC": "A",
+    "TCA": "S", "CCA": "P", "ACA": "T", "GCA": "A",
+    "TCG": "S", "CCG": "P", "ACG": "T", "GCG": "A",
+    "TAT": "Y", "CAT": "H", "AAT": "N", "GAT": "D",
+    "TAC": "Y", "CAC": "H", "AAC": "N", "GAC": "D",
+    "TAA": "*", "CAA": "Q", "AAA": "K", "GAA": "E",
+    "TAG": "*", "CAG": "Q", "AAG": "K", "GAG": "E",
+    "TGT": "C", "CGT": "R", "AGT": "S", "GGT": "G",
+    "TGC": "C", "CGC": "R", "AGC": "S", "GGC": "G",
+    "TGA": "*", "CGA": "R", "AGA": "R", "GGA": "G",
+    "TGG": "W", "CGG": "R", "AGG": "R", "GGG": "G"
+})
+
+
+if np is not None:
+    # A/C/G/T (either case) -> 0..3, anything else -> 4
+    _BASE_CODES = np.full(256, 4, dtype=np.uint8)
+    for _code, _base in enumerate("ACGT"):
+        _BASE_CODES[ord(_base)] = _BASE_CODES[ord(_base.lower())] = _code
+
+    # Amino acid for each base-5 codon index; codons with a non-ACGT base -> "X"
+    _AA_LUT = np.frombuffer(bytes(
+        ord(_CODON_TABLE.get("".join("ACGTN"[d] for d in (i // 25, i // 5 % 5, i % 5)), "X"))
+        for i in range(125)
+    ), dtype=np.uint8)
+
+
+def _as_bytes(seq):
+    """ASCII bytes of seq (bytes are returned as they are)"""
+    if isinstance(seq, (bytes, bytearray)):
+        return seq
+    return seq.encode("ascii", "replace")
+
+
+def _comp_table(seq):
+    """Complement table matching the type of seq"""
+    return _COMP_BYTES if isinstance(seq, (bytes, bytearray)) else _COMP_TABLE
+
+
+def base_composition(seq):
+    """Count A, C, G and T (case-insensitive) in one pass over the sequence"""
+    if np is not None:
+        data = np.frombuffer(_as_bytes(seq), dtype=np.uint8)
+        counts = np.bincount(data, minlength=128)
+        return {base: int(counts[ord(base)] + counts[ord(base.lower())])
+                for base in "ACGT"}
+    if isinstance(seq, (bytes, bytearray)):
+        return {base: seq.count(ord(base)) + seq.count(ord(base.lower())) for base in "ACGT"}
+    return {base: seq.count(base) + seq.count(base.lower()) for base in "ACGT"}
+
 
 def gc_content(seq):
     """Calculate GC content percentage"""
-    seq = seq.upper()
     if len(seq) == 0:
         return 0
-    num_G = seq.count("G")
-    num_C = seq.count("C")
-    total = num_C + num_G
+    counts = base_composition(seq)
+    total = counts["G"] + counts["C"]
     return (total / len(seq)) * 100
 
 
@@ -22,11 +89,7 @@ def at_content(seq):
 
 def complement(seq):
     """Get DNA complement"""
-    dic = {"G": "C", "C": "G", "A": "T", "T": "A"}
-    s = list(seq.upper())
-    for i in range(len(s)):
-        s[i] = dic.get(s[i], s[i])
-    return "".join(s)
+    return seq.upper().translate(_comp_table(seq))
 
 
 def reverse(seq):
@@ -36,33 +99,69 @@ def reverse(seq):
 
 def reverse_complement(seq):
     """Get reverse complement"""
-    return complement(reverse(seq))
+    return seq.upper().translate(_comp_table(seq))[::-1]
 
 
 def translate(seq):
     """Translate DNA to protein"""
-    codon_table = {
-        "TTT": "F", "CTT": "L", "ATT": "I", "GTT": "V",
-        "TTC": "F", "CTC": "L", "ATC": "I", "GTC": "V",
-        "TTA": "L", "CTA": "L", "ATA": "I", "GTA": "V",
-        "TTG": "L", "CTG": "L", "ATG": "M", "GTG": "V",
-        "TCT": "S", "CCT": "P", "ACT": "T", "GCT": "A",
-        "TCC": "S", "CCC": "P", "ACC": "T", "GCC": "A",
-        "TCA": "S", "CCA": "P", "ACA": "T", "GCA": "A",
-        "TCG": "S", "CCG": "P", "ACG": "T", "GCG": "A",
-        "TAT": "Y", "CAT": "H", "AAT": "N", "GAT": "D",
-        "TAC": "Y", "CAC": "H", "AAC": "N", "GAC": "D",
-        "TAA": "*", "CAA": "Q", "AAA": "K", "GAA": "E",
-        "TAG": "*", "CAG": "Q", "AAG": "K", "GAG": "E",
-        "TGT": "C", "CGT": "R", "AGT": "S", "GGT": "G",
-        "TGC": "C", "CGC": "R", "AGC": "S", "GGC": "G",
-        "TGA": "*", "CGA": "R", "AGA": "R", "GGA": "G",
-        "TGG": "W", "CGG": "R", "AGG": "R", "GGG": "G"
-    }
+    if np is None:
+        seq = seq.upper()
+    return _translate_upper(seq)
+
+
+def _translate_upper(seq):
+    """translate() for a sequence already upper-cased by the caller"""
+    if np is not None:
+        n = len(seq) // 3 * 3
+        if n == 0:
+            return ""
+        data = np.frombuffer(_as_bytes(seq), dtype=np.uint8)[:n]
+        codons = _BASE_CODES[data].reshape(-1, 3)
+        idx = codons[:, 0] * 25 + codons[:, 1] * 5 + codons[:, 2]
+        return _AA_LUT[idx].tobytes().decode("ascii")
+
+    if isinstance(seq, (bytes, bytearray)):
+        seq = seq.decode("ascii", "replace")
+    get_aa = _CODON_TABLE.get
+    return "".join([get_aa(seq[i:i+3], "X") for i in range(0, len(seq) - 2, 3)])
+
+
+def _upper_composition(seq):
+    """base_composition() for a sequence already upper-cased by the caller"""
+    if np is not None:
+        return base_composition(seq)
+    if isinstance(seq, (bytes, bytearray)):
+        return {base: seq.count(ord(base)) for base in "ACGT"}
+    return {base: seq.count(base) for base in "ACGT"}
+
+
+def analyze_sequence(seq):
+    """
+    Run every DNA analysis on a sequence, upper-casing and counting it once;
+    the helpers below all work on that one upper-cased copy
     
-    seq = seq.upper()
-    protein = ""
-    for i in range(0, len(seq) - 2, 3):
-        codon = seq[i:i+3]
-        protein += codon_table.get(codon, "X")
-    return protein
\ No newline at end of file
+    Args:
+        seq: DNA sequence (str or ASCII bytes)
+    
+    Returns:
+        Dictionary with length, GC/AT content, complement, reverse,
+        reverse complement (all of seq's type) and translation
+    """
+    seq = seq.strip().upper()
+    # The numpy paths read bytes, so encode once for both of them
+    data = _as_bytes(seq) if np is not None else seq
+    if seq:
+        counts = _upper_composition(data)
+        gc = ((counts["G"] + counts["C"]) / len(seq)) * 100
+    else:
+        gc = 0
+    comp = seq.translate(_comp_table(seq))
+    return {
+        "length": len(seq),
+        "gc_content": gc,
+        "at_content": 100 - gc,
+        "complement": comp,
+        "reverse": seq[::-1],
+        "reverse_complement": comp[::-1],
+        "translation": _translate_upper(data)
+    }
@@ -4,6 +4,182 @@ Calculates the minimum number of operations needed to transform one sequence int
 Operations: Insertion, Deletion, Substitution
 """
 
+import multiprocessing
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - fall back to the pure-Python DP
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to the numpy row DP
+    njit = None
+
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:  # rapidfuzz is optional - fall back to the kernels below
+    _rf_levenshtein = None
+
+try:
+    from ._kernels import edit_distance as _c_edit_distance
+except ImportError:  # compiled kernels are optional (see build_kernels.py)
+    _c_edit_distance = None
+
+
+if np is not None and njit is not None:
+    # Not cached to disk: numba's cache locator fails inside a frozen .exe
+    @njit(boundscheck=False)
+    def _myers_blocks_nb(peq, yi, m):
+        """Block bit-parallel edit distance (Hyyro's extension of Myers):
+        peq[c, b] masks where symbol c occurs in x[64*b:64*b+64], yi holds
+        the symbol codes of y and m = len(x)"""
+        nblocks = peq.shape[1]
+        zero = np.uint64(0)
+        one = np.uint64(1)
+        top = np.uint64(63)
+        last_bit = one << np.uint64((m - 1) % 64)
+        vp = np.empty(nblocks, dtype=np.uint64)
+        vp[:] = ~zero
+        vn = np.zeros(nblocks, dtype=np.uint64)
+        score = m
+        for c in yi:
+            # Horizontal step carried into the top of each block; the top
+            # row is D[0][j] = j, so the first block always gets +1
+            h_in = 1
+            for b in range(nblocks):
+                pv = vp[b]
+                mv = vn[b]
+                eq = peq[c, b]
+                xv = eq | mv
+                if h_in < 0:
+                    eq |= one
+                xh = (((eq & pv) + pv) ^ pv) | eq
+                ph = mv | ~(xh | pv)
+                mh = pv & xh
+                h_out = 0
+                if (ph >> top) & one:
+                    h_out = 1
+                elif (mh >> top) & one:
+                    h_out = -1
+                if b == nblocks - 1:
+                    # Row m-1 of the last block is the bottom row of D
+                    if ph & last_bit:
+                        score += 1
+                    elif mh & last_bit:
+                        score -= 1
+                ph <<= one
+                mh <<= one
+                if h_in < 0:
+                    mh |= one
+                elif h_in > 0:
+                    ph |= one
+                vp[b] = mh | ~(xv | ph)
+                vn[b] = ph & xv
+                h_in = h_out
+        return score
+    
+    @njit(boundscheck=False)
+    def _last_row_nb(xc, yc):
+        """Bottom row of the DP over code-point arrays, via two rolling rows"""
+        m = yc.shape[0]
+        prev = np.arange(m + 1, dtype=np.int32)
+        curr = np.empty(m + 1, dtype=np.int32)
+        for i in range(1, xc.shape[0] + 1):
+            curr[0] = i
+            xi = xc[i - 1]
+            for j in range(1, m + 1):
+                best = prev[j - 1] + (0 if xi == yc[j - 1] else 1)
+                d_del = prev[j] + 1
+                if d_del < best:
+                    best = d_del
+                d_ins = curr[j - 1] + 1
+                if d_ins < best:
+                    best = d_ins
+                curr[j] = best
+            prev, curr = curr, prev
+        return prev
+    
+    @njit(boundscheck=False)
+    def _edit_matrix_nb(xc, yc, D):
+        """Fill the full DP matrix D in place (row 0 and column 0 already set)"""
+        for i in range(1, xc.shape[0] + 1):
+            xi = xc[i - 1]
+            for j in range(1, yc.shape[0] + 1):
+                best = D[i - 1, j - 1] + (0 if xi == yc[j - 1] else 1)
+                d_del = D[i - 1, j] + 1
+                if d_del < best:
+                    best = d_del
+                d_ins = D[i, j - 1] + 1
+                if d_ins < best:
+                    best = d_ins
+                D[i, j] = best
+    
+    @njit(boundscheck=False)
+    def _traceback_nb(xc, yc, D, ops):
+        """Walk D back from the bottom-right cell, writing operation codes
+        (indices into OPERATIONS) into ops in reverse; returns their count"""
+        i = xc.shape[0]
+        j = yc.shape[0]
+        n = 0
+        while i > 0 or j > 0:
+            if i > 0 and j > 0:
+                delta = 0 if xc[i - 1] == yc[j - 1] else 1
+                if D[i, j] == D[i - 1, j - 1] + delta:
+                    ops[n] = delta  # match or substitute
+                    i -= 1
+                    j -= 1
+                elif D[i, j] == D[i - 1, j] + 1:
+                    ops[n] = 2
+                    i -= 1
+                else:
+                    ops[n] = 3
+                    j -= 1
+            elif i > 0:
+                ops[n] = 2
+                i -= 1
+            else:
+                ops[n] = 3
+                j -= 1
+            n += 1
+        return n
+else:
+    _myers_blocks_nb = None
+    _last_row_nb = None
+    _edit_matrix_nb = None
+    _traceback_nb = None
+
+
+# Longest shorter sequence for which edit_distance_DP uses the bit-vector path
+MYERS_MAX_LEN = 64
+
+# First band half-width tried by the pure-Python fallback; doubled until
+# the distance fits
+BANDED_START_K = 8
+
+# Alignment operations, in the order of the codes used by _traceback_nb
+OPERATIONS = ('match', 'substitute', 'delete', 'insert')
+
+# Alignments of at most this many DP cells (2 MB as int16) use the full
+# matrix; hirschberg_alignment splits larger ones
+HIRSCHBERG_BASE_CELLS = 1 << 20
+
+# Pairs with a sequence longer than this are not memoised, to bound the cache
+MEMO_MAX_LEN = 512
+
+# From this many queries edit_distance_batch spreads the work over a process
+# pool; below it, pool start-up costs more than it saves
+PARALLEL_MIN_QUERIES = 64
+
+# Target sequence shared with pool workers
+_worker_target = None
+
+
+def _code_points(s):
+    """String as a uint32 array of code points, for the numba kernels"""
+    return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+
 
 def edit_distance_DP(x, y):
     """
@@ -16,33 +192,316 @@ def edit_distance_DP(x, y):
     Returns:
         int: Minimum edit distance
     """
-    # Initialize DP matrix
-    D = []
-    for i in range(len(x) + 1):
-        D.append([0] * (len(y) + 1))
+    if len(x) <= MEMO_MAX_LEN and len(y) <= MEMO_MAX_LEN:
+        # Edit distance is symmetric, so (x, y) and (y, x) share one entry
+        if y < x:
+            x, y = y, x
+        return _edit_distance_cached(x, y)
+    return _edit_distance(x, y)
+
+
+@lru_cache(maxsize=10_000)
+def _edit_distance_cached(x, y):
+    """Memoised _edit_distance for short pairs (see edit_distance_DP)"""
+    return _edit_distance(x, y)
+
+
+def cache_clear():
+    """Empty the edit_distance_DP memo"""
+    _edit_distance_cached.cache_clear()
+
+
+def edit_distance_batch(queries, target, workers=None):
+    """
+    Calculate the edit distance from each query to one target sequence.
     
-    # Initialize first column (deletions from x)
-    for i in range(len(x) + 1):
-        D[i][0] = i
+    Args:
+        queries (list): Sequences to compare
+        target (str): Sequence every query is compared against
+        workers (int): Number of worker processes (None = one per CPU,
+                       1 = run in this process)
     
-    # Initialize first row (insertions to match y)
-    for i in range(len(y) + 1):
-        D[0][i] = i
+    Returns:
+        list: Edit distance for each query, in order
+    """
+    if workers == 1 or len(queries) < PARALLEL_MIN_QUERIES:
+        return [edit_distance_DP(q, target) for q in queries]
+    
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(target,)) as pool:
+        return pool.map(_pool_edit_distance, queries)
+
+
+def warm_up():
+    """Compile the numba kernels on tiny inputs, so the first real call does
+    not wait for compilation (does nothing without numba)"""
+    if _myers_blocks_nb is None:
+        return
+    _edit_distance_blocks("A", "A")
+    _last_row("A", "A")
+    _, D = edit_distance_with_matrix("A", "A")
+    traceback_alignment("A", "A", D)
+
+
+def _init_worker(target):
+    """Pool initializer: receive the target once and compile the numba kernel"""
+    global _worker_target
+    _worker_target = target
+    if _myers_blocks_nb is not None:
+        _edit_distance_blocks("A", "A")
+
+
+def _pool_edit_distance(query):
+    """Pool worker: edit distance from query to the target from _init_worker"""
+    return edit_distance_DP(query, _worker_target)
+
+
+def _edit_distance(x, y):
+    """Uncached edit distance: dispatches to rapidfuzz, C, Myers, block Myers or the two-row DP"""
+    if _rf_levenshtein is not None:
+        return _rf_levenshtein.distance(x, y)
+    
+    if _c_edit_distance is not None and x.isascii() and y.isascii():
+        return _c_edit_distance(x.encode("ascii"), y.encode("ascii"))
+    
+    # Edit distance is symmetric, so keep the shorter sequence along the row
+    if len(y) > len(x):
+        x, y = y, x
+    
+    if len(y) <= MYERS_MAX_LEN:
+        return edit_distance_myers(y, x)
+    
+    if _myers_blocks_nb is not None:
+        return _edit_distance_blocks(y, x)
+    
+    if np is not None:
+        return _edit_distance_rows(x, y)
+    
+    return _edit_distance_doubling(x, y)
+
+
+def _edit_distance_doubling(x, y):
+    """Pure-Python edit distance via edit_distance_banded, doubling the band
+    until the distance fits; similar sequences cost O(d * len(x))"""
+    k = max(BANDED_START_K, abs(len(x) - len(y)))
+    # Once the band is as wide as the shorter sequence it is no cheaper
+    # than the full two-row DP
+    while 2 * k + 1 < min(len(x), len(y)):
+        distance = edit_distance_banded(x, y, k)
+        if distance is not None:
+            return distance
+        k *= 2
+    return _last_row_py(x, y)[-1]
+
+
+def _last_row(x, y):
+    """Bottom row of the DP matrix (D[len(x)][j] for every j) in O(len(y)) memory"""
+    if _last_row_nb is not None:
+        return _last_row_nb(_code_points(x), _code_points(y))
+    if np is not None:
+        return _last_row_np(x, y)
+    return _last_row_py(x, y)
+
+
+def _last_row_py(x, y):
+    """Bottom row of the DP, filled cell by cell in pure Python"""
+    # Only the previous row is needed to fill the current one, so keep two
+    # rows instead of the full matrix (use edit_distance_with_matrix when
+    # the matrix is needed for traceback)
+    prev = list(range(len(y) + 1))   # row 0: insertions to match y
+    curr = [0] * (len(y) + 1)
     
-    # Fill the DP matrix
     for i in range(1, len(x) + 1):
+        curr[0] = i  # first column: deletions from x
         for j in range(1, len(y) + 1):
             # Cost of substitution (0 if characters match, 1 if different)
             delta = 1 if x[i-1] != y[j-1] else 0
             
             # Choose minimum cost operation
-            D[i][j] = min(
-                D[i-1][j-1] + delta,  # Substitution (or match)
-                D[i-1][j] + 1,         # Deletion
-                D[i][j-1] + 1          # Insertion
+            curr[j] = min(
+                prev[j-1] + delta,  # Substitution (or match)
+                prev[j] + 1,        # Deletion
+                curr[j-1] + 1       # Insertion
             )
+        prev, curr = curr, prev
+    
+    return prev
+
+
+def _edit_distance_blocks(x, y):
+    """Myers' bit-parallel edit distance for any len(x), with x split into
+    64-bit blocks (run by the numba kernel _myers_blocks_nb)"""
+    xc = _code_points(x)
+    yc = _code_points(y)
+    
+    # Symbol codes: x's distinct characters, then one code for the rest
+    alphabet = np.unique(xc)
+    found = np.minimum(np.searchsorted(alphabet, yc), len(alphabet) - 1)
+    yi = np.where(alphabet[found] == yc, found, len(alphabet))
+    
+    # peq[c]: bit i of block b set where x[64*b + i] is symbol c
+    nblocks = (len(xc) + 63) // 64
+    bits = np.zeros((len(alphabet) + 1, nblocks * 64), dtype=np.uint8)
+    bits[np.searchsorted(alphabet, xc), np.arange(len(xc))] = 1
+    peq = np.packbits(bits, axis=1, bitorder="little").view("<u8").astype(np.uint64)
+    
+    return int(_myers_blocks_nb(peq, yi, len(xc)))
+
+
+def _edit_distance_rows(x, y):
+    """Two-row edit distance DP with each row computed as numpy vector ops"""
+    return int(_last_row_np(x, y)[-1])
+
+
+def _last_row_np(x, y):
+    """Bottom row of the DP, each row computed as numpy vector ops"""
+    yc = _code_points(y)
+    offsets = np.arange(len(yc) + 1, dtype=np.int64)
+    prev = offsets.copy()
+    curr = np.empty_like(prev)
+    
+    for i, xi in enumerate(_code_points(x), 1):
+        curr[0] = i
+        # Substitution (or match) and deletion only depend on the previous row
+        np.minimum(prev[:-1] + (yc != xi), prev[1:] + 1, out=curr[1:])
+        # Insertion chains left to right: curr[j] = min(curr[k] + j - k) over
+        # k <= j, which is a running minimum of curr[k] - k
+        curr -= offsets
+        np.minimum.accumulate(curr, out=curr)
+        curr += offsets
+        prev, curr = curr, prev
+    
+    return prev
+
+
+def _matrix_dtype(x, y):
+    """Narrowest integer dtype for the DP matrix of x and y: no cell
+    exceeds max(len(x), len(y)), so int16 (2 bytes a cell) nearly always fits"""
+    # Strictly below the int16 maximum: the fill and the traceback add 1 to
+    # a cell before comparing, and that must not wrap either
+    if max(len(x), len(y)) < np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+
+def _edit_matrix_rows(x, y):
+    """Full DP matrix with each row computed as numpy vector ops (see _edit_distance_rows)"""
+    yc = _code_points(y)
+    dtype = _matrix_dtype(x, y)
+    offsets = np.arange(len(yc) + 1, dtype=dtype)
+    D = np.empty((len(x) + 1, len(yc) + 1), dtype=dtype)
+    D[0] = offsets
+    
+    for i, xi in enumerate(_code_points(x), 1):
+        prev, curr = D[i - 1], D[i]
+        curr[0] = i
+        np.minimum(prev[:-1] + (yc != xi), prev[1:] + 1, out=curr[1:])
+        curr -= offsets
+        np.minimum.accumulate(curr, out=curr)
+        curr += offsets
+    
+    return D
+
+
+def edit_distance_myers(x, y):
+    """
+    Calculate edit distance with Myers' bit-parallel algorithm.
+    
+    Each column of the DP matrix is kept as bit vectors of +1/-1 vertical
+    differences over x, so a whole column is updated with a handful of
+    integer operations. Fastest when x fits in a machine word (<= 64).
+    
+    Args:
+        x (str): First sequence (the one encoded as bit vectors)
+        y (str): Second sequence
+    
+    Returns:
+        int: Minimum edit distance
+    """
+    m = len(x)
+    if m == 0:
+        return len(y)
+    
+    # Peq[c]: bit i set where x[i] == c
+    peq = {}
+    for i, c in enumerate(x):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    
+    full = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    vp, vn = full, 0
+    score = m
+    
+    for c in y:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        d0 = (((vp + (xv & vp)) & full) ^ vp) | xv
+        hn = vp & d0
+        hp = (vn | ~(vp | d0)) & full
+        
+        if hp & high_bit:
+            score += 1
+        elif hn & high_bit:
+            score -= 1
+        
+        # Shift in the +1 horizontal step of the top row (D[0][j] = j)
+        xh = ((hp << 1) | 1) & full
+        vn = xh & d0
+        vp = ((hn << 1) | ~(xh | d0)) & full
+    
+    return score
+
+
+def edit_distance_banded(x, y, max_k):
+    """
+    Calculate edit distance if it is at most max_k (Ukkonen's banded DP).
+    
+    Only cells within max_k of the main diagonal can lie on a path of cost
+    <= max_k, so each row keeps a band of 2*max_k + 1 cells indexed by
+    diagonal d = j - i. Cost is O(max_k * len(x)) instead of O(len(x) * len(y)).
+    
+    Args:
+        x (str): First sequence
+        y (str): Second sequence
+        max_k (int): Largest distance of interest
     
-    return D[-1][-1]
+    Returns:
+        int or None: Edit distance, or None if it exceeds max_k
+    """
+    n, m = len(x), len(y)
+    if max_k < 0 or abs(n - m) > max_k:
+        return None
+    
+    inf = max_k + 1
+    width = 2 * max_k + 1
+    
+    # Row 0: D[0][j] = j for the diagonals that exist
+    prev = [inf] * width
+    for d in range(0, min(max_k, m) + 1):
+        prev[d + max_k] = d
+    
+    for i in range(1, n + 1):
+        curr = [inf] * width
+        d_lo = max(-max_k, -i)
+        d_hi = min(max_k, m - i)
+        for d in range(d_lo, d_hi + 1):
+            j = i + d
+            b = d + max_k
+            if j == 0:
+                curr[b] = i
+                continue
+            best = prev[b] + (0 if x[i-1] == y[j-1] else 1)  # Substitution (or match)
+            if b + 1 < width and prev[b + 1] + 1 < best:
+                best = prev[b + 1] + 1                        # Deletion
+            if b > 0 and curr[b - 1] + 1 < best:
+                best = curr[b - 1] + 1                        # Insertion
+            curr[b] = best if best < inf else inf
+        if min(curr) > max_k:
+            return None
+        prev = curr
+    
+    distance = prev[m - n + max_k]
+    return distance if distance <= max_k else None
 
 
 def edit_distance_with_matrix(x, y):
@@ -56,6 +515,19 @@ def edit_distance_with_matrix(x, y):
     Returns:
         tuple: (edit_distance, DP_matrix)
     """
+    if _edit_matrix_nb is not None:
+        # int16/int32 matrix filled by the compiled kernel; D[i][j] indexing (and
+        # so format_matrix and traceback_alignment) works as for the lists
+        D = np.empty((len(x) + 1, len(y) + 1), dtype=_matrix_dtype(x, y))
+        D[:, 0] = np.arange(len(x) + 1)
+        D[0, :] = np.arange(len(y) + 1)
+        _edit_matrix_nb(_code_points(x), _code_points(y), D)
+        return int(D[-1, -1]), D
+    
+    if np is not None:
+        D = _edit_matrix_rows(x, y)
+        return int(D[-1, -1]), D
+    
     # Initialize DP matrix
     D = []
     for i in range(len(x) + 1):
@@ -94,6 +566,9 @@ def traceback_alignment(x, y, D):
     Returns:
         tuple: (aligned_x, aligned_y, operations)
     """
+    if _traceback_nb is not None and isinstance(D, np.ndarray):
+        return _traceback_array(x, y, D)
+    
     i = len(x)
     j = len(y)
     
@@ -144,12 +619,78 @@ def traceback_alignment(x, y, D):
     return ''.join(aligned_x), ''.join(aligned_y), operations
 
 
+def hirschberg_alignment(x, y):
+    """
+    Find an optimal alignment in linear memory (Hirschberg's algorithm).
+    
+    x is split in half and the column where an optimal path crosses the
+    middle row is found from a forward DP row over the first half plus a
+    backward one over the second; both halves are then aligned the same
+    way. Pieces of at most HIRSCHBERG_BASE_CELLS cells use the full matrix.
+    
+    Args:
+        x (str): First sequence
+        y (str): Second sequence
+    
+    Returns:
+        tuple: (aligned_x, aligned_y, operations), as from traceback_alignment
+    """
+    aligned_x, aligned_y, operations = [], [], []
+    _hirschberg(x, y, aligned_x, aligned_y, operations)
+    return ''.join(aligned_x), ''.join(aligned_y), operations
+
+
+def _hirschberg(x, y, aligned_x, aligned_y, operations):
+    """Append an optimal alignment of x and y to the output lists"""
+    if len(x) < 2 or (len(x) + 1) * (len(y) + 1) <= HIRSCHBERG_BASE_CELLS:
+        _, D = edit_distance_with_matrix(x, y)
+        piece_x, piece_y, piece_ops = traceback_alignment(x, y, D)
+        aligned_x.append(piece_x)
+        aligned_y.append(piece_y)
+        operations.extend(piece_ops)
+        return
+    
+    mid = len(x) // 2
+    fwd = _last_row(x[:mid], y)
+    rev = _last_row(x[mid:][::-1], y[::-1])
+    
+    # Cost of the best path through (mid, j) is fwd[j] + rev[len(y) - j]
+    if np is not None and isinstance(fwd, np.ndarray):
+        split = int(np.argmin(fwd + rev[::-1]))
+    else:
+        costs = [f + r for f, r in zip(fwd, reversed(rev))]
+        split = costs.index(min(costs))
+    
+    _hirschberg(x[:mid], y[:split], aligned_x, aligned_y, operations)
+    _hirschberg(x[mid:], y[split:], aligned_x, aligned_y, operations)
+
+
+def _traceback_array(x, y, D):
+    """traceback_alignment for a numpy D, walked by the numba kernel"""
+    xc = _code_points(x)
+    yc = _code_points(y)
+    ops = np.empty(len(xc) + len(yc), dtype=np.int8)
+    ops = ops[:_traceback_nb(xc, yc, D, ops)][::-1]
+    
+    # Every non-insert consumes the next character of x, every non-delete
+    # the next character of y; the other side gets a gap
+    gap = np.uint32(ord('-'))
+    aligned_x = np.full(len(ops), gap, dtype=np.uint32)
+    aligned_x[ops != 3] = xc
+    aligned_y = np.full(len(ops), gap, dtype=np.uint32)
+    aligned_y[ops != 2] = yc
+    
+    return (aligned_x.astype("<u4").tobytes().decode("utf-32-le"),
+            aligned_y.astype("<u4").tobytes().decode("utf-32-le"),
+            [OPERATIONS[op] for op in ops.tolist()])
+
+
 def format_matrix(D, x, y):
     """
     Format DP matrix for display.
     
     Args:
-        D (list): DP matrix
+        D (list or numpy.ndarray): DP matrix
         x (str): First sequence
         y (str): Second sequence
     
@@ -158,6 +699,10 @@ def format_matrix(D, x, y):
     """
     result = []
     
+    # Whole rows as Python ints in one call, instead of a numpy scalar
+    # per D[i][j] lookup
+    rows = D.tolist() if hasattr(D, "tolist") else D
+    
     # Header row
     header = "      " + "  ".join([" "] + list(y))
     result.append(header)
@@ -170,7 +715,7 @@ def format_matrix(D, x, y):
         else:
             row_label = x[i-1]
         
-        row = f"{row_label:2} | " + "  ".join(f"{D[i][j]:2}" for j in range(len(y) + 1))
+        row = f"{row_label:2} | " + "  ".join(f"{v:2}" for v in rows[i])
         result.append(row)
     
     return "\n".join(result)
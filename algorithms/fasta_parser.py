@@ -3,6 +3,27 @@ FASTA Parser Module - Based on Original Algorithm
 Uses flag-based parsing from section1.py
 """
 
+import io
+
+from .dna_operations import base_composition
+
+# ASCII bytes other than A/T/G/C/N, deleted from sequence lines by bytes.translate
+_NON_BASES = bytes(c for c in range(128) if chr(c) not in 'ATGCN')
+
+# Error message when the input holds no usable records
+NO_SEQUENCES_MESSAGE = (
+    "No valid FASTA sequences found.\n\n"
+    "Required format:\n"
+    ">header_name\n"
+    "ATGCGATCG...\n"
+    ">another_header\n"
+    "GCTAGCTA...\n\n"
+    "Make sure:\n"
+    "- Each header starts with '>'\n"
+    "- Each sequence is on the line after its header\n"
+    "- Headers and sequences alternate"
+)
+
 
 def parse_simple_fasta(content):
     """
@@ -18,13 +39,40 @@ def parse_simple_fasta(content):
     Returns:
         List of (header, sequence) tuples
     """
-    sequences = []
+    # Split into lines in one pass - handles \n, \r\n and \r
+    sequences = list(_parse_lines(content.splitlines()))
+    
+    if not sequences:
+        raise ValueError(NO_SEQUENCES_MESSAGE)
+    
+    return sequences
+
+
+def parse_simple_fasta_stream(handle):
+    """
+    Parse FASTA records one at a time from a binary file handle
+    
+    Same rules and results as parse_simple_fasta on the decoded file,
+    without holding the whole file (or the record list) in memory.
+    
+    Args:
+        handle: File opened in binary mode
+        
+    Yields:
+        (header, sequence) tuples
+    """
+    text = io.TextIOWrapper(handle, encoding='utf-8', errors='replace', newline=None)
+    # Re-split each line so the other separators str.splitlines knows
+    # (\v, \f, \x85, ...) break lines exactly as in parse_simple_fasta
+    lines = (part for line in text for part in line.splitlines())
+    return _parse_lines(lines)
+
+
+def _parse_lines(lines):
+    """Flag-based parser over an iterable of lines; yields (header, sequence)"""
     flag = 0
     current_header = None
     
-    # Split into lines - handle all newline types
-    lines = content.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-    
     for line in lines:
         line = line.strip()
         
@@ -43,31 +91,17 @@ def parse_simple_fasta(content):
                 
         else:  # flag == 1
             # Expecting sequence
-            # Clean the sequence - keep only ATGCN
-            clean_seq = ''.join(c for c in line.upper() if c in 'ATGCN')
+            # Clean the sequence - keep only ATGCN (non-ASCII characters are
+            # dropped by the encode, everything else in one translate pass)
+            clean_seq = line.upper().encode('ascii', 'ignore').translate(
+                None, _NON_BASES).decode('ascii')
             
             if clean_seq and current_header is not None:
-                sequences.append((current_header, clean_seq))
+                yield current_header, clean_seq
             
             # Reset for next sequence
             flag = 0
             current_header = None
-    
-    if not sequences:
-        raise ValueError(
-            "No valid FASTA sequences found.\n\n"
-            "Required format:\n"
-            ">header_name\n"
-            "ATGCGATCG...\n"
-            ">another_header\n"
-            "GCTAGCTA...\n\n"
-            "Make sure:\n"
-            "- Each header starts with '>'\n"
-            "- Each sequence is on the line after its header\n"
-            "- Headers and sequences alternate"
-        )
-    
-    return sequences
 
 
 def parse_fasta_with_labels(content, hemolytic_keywords=None):
@@ -129,6 +163,43 @@ def get_fasta_stats(sequences):
     }
 
 
+def summarize_fasta(records, keep=100):
+    """
+    Statistics of a stream of records, keeping only the first few
+    
+    Args:
+        records: Iterable of (header, sequence) tuples
+        keep: Number of records to return for display
+        
+    Returns:
+        Tuple of (stats dictionary as in get_fasta_stats, first records)
+    """
+    first = []
+    count = total = 0
+    min_length = max_length = 0
+    
+    for header, seq in records:
+        length = len(seq)
+        if count == 0:
+            min_length = max_length = length
+        elif length < min_length:
+            min_length = length
+        elif length > max_length:
+            max_length = length
+        count += 1
+        total += length
+        if len(first) < keep:
+            first.append((header, seq))
+    
+    return {
+        'num_sequences': count,
+        'total_length': total,
+        'avg_length': total / count if count else 0,
+        'min_length': min_length,
+        'max_length': max_length
+    }, first
+
+
 def validate_dna_sequence(seq):
     """Check if sequence contains only valid DNA bases"""
     valid_bases = set('ATGCN')
@@ -151,8 +222,7 @@ def gc_content(seq):
     if l == 0:
         return 0.0
     
-    num_G = seq.upper().count("G")
-    num_C = seq.upper().count("C")
-    total = num_C + num_G
+    counts = base_composition(seq)
+    total = counts["G"] + counts["C"]
     
     return total / l
\ No newline at end of file
@@ -3,25 +3,73 @@ Index Search Module
 K-mer indexing for fast pattern matching
 """
 
-import bisect
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - fall back to the Python loop
+    np = None
+
+# Longest k-mer that fits in a uint64 at 2 bits per base
+MAX_PACKED_K = 31
+
+if np is not None:
+    # A/C/G/T -> 0..3, anything else (including lower case) -> 4
+    _BASE_CODES = np.full(256, 4, dtype=np.uint8)
+    for _code, _base in enumerate("ACGT"):
+        _BASE_CODES[ord(_base)] = _code
 
 
 def build_index(seq, k):
     """
-    Build sorted k-mer index
+    Build k-mer hash index
     
     Args:
         seq: DNA sequence
         k: K-mer size
         
     Returns:
-        Sorted list of (k-mer, position) tuples
+        Dictionary mapping each k-mer to its sorted list of positions
     """
-    index = []
+    if np is not None and 0 < k <= MAX_PACKED_K and len(seq) >= k:
+        return _build_index_packed(seq, k)
+    
+    index = defaultdict(list)
     for i in range(len(seq) - k + 1):
-        kmer = seq[i:i+k]
-        index.append((kmer, i))
-    index.sort()
+        index[seq[i:i+k]].append(i)
+    return dict(index)
+
+
+def _build_index_packed(seq, k):
+    """
+    build_index using 2-bit packed k-mers: every window is encoded as an
+    integer and grouped with one stable sort, so Python work is per
+    distinct k-mer rather than per position. Windows containing anything
+    other than A/C/G/T are indexed by the plain string path.
+    """
+    codes = _BASE_CODES[np.frombuffer(seq.encode("ascii", "replace"), dtype=np.uint8)]
+    n = len(codes) - k + 1
+    
+    invalid = np.concatenate(([0], np.cumsum(codes == 4)))
+    bad = invalid[k:] - invalid[:n] > 0
+    
+    packed = np.zeros(n, dtype=np.uint64)
+    for t in range(k):
+        packed = (packed << np.uint64(2)) | codes[t:t+n].astype(np.uint64)
+    
+    good_pos = np.flatnonzero(~bad)
+    keys = packed[good_pos]
+    index = {}
+    if len(keys):
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+        ends = np.append(starts[1:], len(sorted_keys))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            positions = good_pos[order[start:end]].tolist()
+            index[seq[positions[0]:positions[0]+k]] = positions
+    for i in np.flatnonzero(bad).tolist():
+        index.setdefault(seq[i:i+k], []).append(i)
     return index
 
 
@@ -30,7 +78,7 @@ def query_index(index, seq, pattern):
     Query index to find pattern
     
     Args:
-        index: Sorted k-mer index
+        index: K-mer index from build_index
         seq: Original sequence
         pattern: Pattern to search
         
@@ -41,26 +89,27 @@ def query_index(index, seq, pattern):
         return []
     
     # Get k-mer length from index
-    k = len(index[0][0])
-    
-    # Extract all k-mers from index
-    keys = [kmer for kmer, pos in index]
-    
-    # Find range of k-mers that match pattern prefix
-    query_kmer = pattern[:k]
-    st = bisect.bisect_left(keys, query_kmer)
-    en = bisect.bisect_right(keys, query_kmer)
+    k = len(next(iter(index)))
     
-    # Get candidate positions
-    candidates = [pos for kmer, pos in index[st:en]]
-    
-    # Verify full pattern match
-    matches = []
-    for pos in candidates:
-        if seq[pos:pos+len(pattern)] == pattern:
-            matches.append(pos)
+    # Candidate positions share the pattern's first k-mer
+    return filter_matches(seq, pattern, index.get(pattern[:k], []))
+
+
+def filter_matches(seq, pattern, candidates):
+    """
+    Keep the candidate positions where the full pattern occurs
     
-    return sorted(matches)
+    Args:
+        seq: Original sequence
+        pattern: Pattern to search
+        candidates: Sorted positions to verify, e.g. the k-mer hits from
+                    query_index or the matches of a prefix of pattern
+        
+    Returns:
+        List of positions where pattern is found
+    """
+    m = len(pattern)
+    return [pos for pos in candidates if seq[pos:pos+m] == pattern]
 
 
 def get_index_stats(index, seq, k):
@@ -73,14 +122,11 @@ def get_index_stats(index, seq, k):
             'total_kmers': 0
         }
     
-    # Count unique k-mers
-    unique_kmers = len(set(kmer for kmer, pos in index))
-    
     return {
         'sequence_length': len(seq),
         'k': k,
-        'unique_kmers': unique_kmers,
-        'total_kmers': len(index)
+        'unique_kmers': len(index),
+        'total_kmers': sum(len(positions) for positions in index.values())
     }
 
 
@@ -89,28 +135,21 @@ def format_index_table(index, max_rows=20):
     if not index:
         return "Index is empty\n"
     
-    result = "\n"
-    result += f"{'K-mer':<10s} {'Positions':<50s}\n"
-    result += "-" * 60 + "\n"
-    
-    # Group by k-mer
-    kmer_dict = {}
-    for kmer, pos in index:
-        if kmer not in kmer_dict:
-            kmer_dict[kmer] = []
-        kmer_dict[kmer].append(pos)
+    out = ["\n",
+           f"{'K-mer':<10s} {'Positions':<50s}\n",
+           "-" * 60 + "\n"]
     
     # Display
     count = 0
-    for kmer in sorted(kmer_dict.keys()):
+    for kmer in sorted(index):
         if count >= max_rows:
-            remaining = len(kmer_dict) - count
-            result += f"\n... and {remaining} more k-mers\n"
+            remaining = len(index) - count
+            out.append(f"\n... and {remaining} more k-mers\n")
             break
         
-        positions = kmer_dict[kmer]
+        positions = index[kmer]
         pos_str = str(positions) if len(positions) <= 10 else str(positions[:10]) + "..."
-        result += f"{kmer:<10s} {pos_str}\n"
+        out.append(f"{kmer:<10s} {pos_str}\n")
         count += 1
     
-    return result
\ No newline at end of file
+    return "".join(out)
\ No newline at end of file
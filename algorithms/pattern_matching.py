@@ -3,6 +3,90 @@ Pattern Matching Module
 Naive and Boyer-Moore algorithms
 """
 
+import multiprocessing
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - fall back to the Python scan
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to the Python scan
+    njit = None
+
+try:
+    from ._kernels import boyer_moore as _c_boyer_moore
+except ImportError:  # compiled kernels are optional (see build_kernels.py)
+    _c_boyer_moore = None
+
+
+if np is not None and njit is not None:
+    # Not cached to disk: numba's cache locator fails inside a frozen .exe
+    @njit(boundscheck=False)
+    def _boyer_moore_nb(text, pat, last):
+        """Bad character Boyer-Moore over uint8 arrays; returns match positions"""
+        n = text.shape[0]
+        m = pat.shape[0]
+        out = np.empty(16, dtype=np.int64)
+        count = 0
+        i = 0
+        while i <= n - m:
+            j = m - 1
+            while j >= 0 and pat[j] == text[i + j]:
+                j -= 1
+            if j < 0:
+                if count == out.shape[0]:
+                    grown = np.empty(2 * count, dtype=np.int64)
+                    grown[:count] = out
+                    out = grown
+                out[count] = i
+                count += 1
+                i += 1
+            else:
+                shift = j - last[text[i + j]]
+                i += shift if shift > 1 else 1
+        return out[:count]
+else:
+    _boyer_moore_nb = None
+
+# Alignments listed one by one in the naive search walkthrough
+NAIVE_STEPS_MAX = 30
+
+# From this many patterns boyer_moore_batch spreads the work over a process
+# pool; below it, pool start-up costs more than it saves
+PARALLEL_MIN_PATTERNS = 64
+
+# Reference sequence shared with pool workers
+_worker_seq = None
+
+
+# (seq, _encode(seq)) for the last reference encoded, matched by identity:
+# a sweep of many patterns over one reference encodes it only once, without
+# hashing the sequence or keeping older references alive
+_last_encoded = (None, None)
+
+
+def _encode(seq):
+    """ASCII bytes of seq (None if it is not ASCII)"""
+    try:
+        return seq.encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+
+def _encode_reference(seq):
+    """_encode(seq), reused while the same str object is searched again"""
+    global _last_encoded
+    last_seq, encoded = _last_encoded  # one read, so threads see a matching pair
+    if last_seq is not seq:
+        encoded = _encode(seq)
+        _last_encoded = (seq, encoded)
+    return encoded
+
 
 def naive_match(seq, pattern):
     """
@@ -15,13 +99,36 @@ def naive_match(seq, pattern):
     Returns:
         List of positions where pattern is found
     """
+    # str.find runs CPython's C substring search between matches
     positions = []
-    for i in range(len(seq) - len(pattern) + 1):
-        if pattern == seq[i:i+len(pattern)]:
-            positions.append(i)
+    find = seq.find
+    i = find(pattern)
+    while i != -1:
+        positions.append(i)
+        i = find(pattern, i + 1)
     return positions
 
 
+def _naive_match_pedagogical(seq, pattern):
+    """Naive matching as taught: compare the pattern at every alignment,
+    yielding (position, window, matched) for each one"""
+    m = len(pattern)
+    for i in range(len(seq) - m + 1):
+        window = seq[i:i+m]
+        yield i, window, window == pattern
+
+
+def iter_naive_steps(seq, pattern, max_display=NAIVE_STEPS_MAX):
+    """Yield the lines of a walkthrough of the textbook naive search: each
+    alignment it checks (the first max_display of them) and whether it matched"""
+    total = max(len(seq) - len(pattern) + 1, 0)
+    yield f"Alignments checked: {total}\n"
+    for i, window, matched in islice(_naive_match_pedagogical(seq, pattern), max_display):
+        yield f"  {i:>5}  {window}  {'✓ match' if matched else '✗'}\n"
+    if total > max_display:
+        yield f"  ... and {total - max_display} more alignments\n"
+
+
 def boyer_moore_match(seq, pattern):
     """
     Boyer-Moore algorithm with Bad Character table
@@ -33,20 +140,45 @@ def boyer_moore_match(seq, pattern):
     Returns:
         Tuple of (positions, bad_char_table_dict)
     """
-    # Build Bad Character table as dictionary
+    # Build Bad Character table as dictionary (shift from the pattern end,
+    # returned for display)
     bad_char = {}
     for i, char in enumerate(pattern):
         bad_char[char] = len(pattern) - 1 - i
     
+    # Scan bytes when possible: indexing bytes yields ints, so no 1-char
+    # str objects are created per comparison
+    text = _encode_reference(seq)
+    pat = _encode(pattern)
+    if text is not None and pat is not None:
+        if _c_boyer_moore is not None:
+            return _c_boyer_moore(text, pat), bad_char
+        if _boyer_moore_nb is not None:
+            last = np.full(256, -1, dtype=np.int64)
+            last[np.frombuffer(pat, dtype=np.uint8)] = np.arange(len(pat))
+            positions = _boyer_moore_nb(np.frombuffer(text, dtype=np.uint8),
+                                        np.frombuffer(pat, dtype=np.uint8), last)
+            return positions.tolist(), bad_char
+        last = [-1] * 256
+    else:
+        text, pat = seq, pattern
+        last = defaultdict(lambda: -1)
+    
+    # Last occurrence of each character in the pattern, used for the shift
+    for i, char in enumerate(pat):
+        last[char] = i
+    last_of = last.__getitem__
+    
     # Search using Bad Character heuristic
     positions = []
+    m = len(pat)
     i = 0
     
-    while i <= len(seq) - len(pattern):
-        j = len(pattern) - 1
+    while i <= len(text) - m:
+        j = m - 1
         
         # Check pattern from right to left
-        while j >= 0 and pattern[j] == seq[i + j]:
+        while j >= 0 and pat[j] == text[i + j]:
             j -= 1
         
         if j < 0:
@@ -54,54 +186,102 @@ def boyer_moore_match(seq, pattern):
             positions.append(i)
             i += 1
         else:
-            # Mismatch - use bad character rule
-            bad_char_shift = bad_char.get(seq[i + j], len(pattern))
-            i += max(1, bad_char_shift)
+            # Mismatch - align the mismatched character with its last
+            # occurrence in the pattern (or move past it)
+            i += max(1, j - last_of(text[i + j]))
     
     return positions, bad_char
 
 
+def warm_up():
+    """Compile the numba kernel on a tiny input, so the first real search
+    does not wait for compilation (does nothing without numba)"""
+    if _boyer_moore_nb is not None and _c_boyer_moore is None:
+        boyer_moore_match("AA", "A")
+
+
+def boyer_moore_batch(seq, patterns, workers=None):
+    """
+    Boyer-Moore search for many patterns in one sequence
+    
+    Args:
+        seq: Main sequence
+        patterns: List of patterns to search
+        workers: Number of worker processes (None = one per CPU,
+                 1 = run in this process)
+        
+    Returns:
+        List of match position lists, one per pattern
+    """
+    if workers == 1 or len(patterns) < PARALLEL_MIN_PATTERNS:
+        return [boyer_moore_match(seq, pattern)[0] for pattern in patterns]
+    
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(seq,)) as pool:
+        return pool.map(_pool_boyer_moore, patterns)
+
+
+def _init_worker(seq):
+    """Pool initializer: receive the reference sequence once per worker"""
+    global _worker_seq
+    _worker_seq = seq
+
+
+def _pool_boyer_moore(pattern):
+    """Pool worker: match positions of pattern in the sequence from _init_worker"""
+    return boyer_moore_match(_worker_seq, pattern)[0]
+
+
 def format_bad_char_table(bad_char, pattern):
     """Format Bad Character table for display"""
-    result = "\nCharacter | Shift\n"
-    result += "-" * 20 + "\n"
+    out = ["\nCharacter | Shift\n", "-" * 20 + "\n"]
     
     # Show shifts for characters in pattern
     seen = set()
     for char in pattern:
         if char not in seen:
             shift = bad_char.get(char, len(pattern))
-            result += f"{char:9s} | {shift:5d}\n"
+            out.append(f"{char:9s} | {shift:5d}\n")
             seen.add(char)
     
     # Show shift for characters not in pattern
-    result += f"{'Other':9s} | {len(pattern):5d}\n"
+    out.append(f"{'Other':9s} | {len(pattern):5d}\n")
     
-    return result
+    return "".join(out)
+
+
+@lru_cache(maxsize=32)
+def format_pattern_bad_char_table(pattern):
+    """format_bad_char_table for the table boyer_moore_match builds from
+    pattern, memoised per pattern"""
+    bad_char = {char: len(pattern) - 1 - i for i, char in enumerate(pattern)}
+    return format_bad_char_table(bad_char, pattern)
 
 
 def format_match_results(seq, pattern, positions, max_display=10):
     """Format match results with context"""
+    return "".join(iter_match_results(seq, pattern, positions, max_display))
+
+
+def iter_match_results(seq, pattern, positions, max_display=10):
+    """Yield the lines of format_match_results one at a time"""
     if not positions:
-        return "No matches found.\n"
-    
-    result = ""
+        yield "No matches found.\n"
+        return
     
     for i, pos in enumerate(positions[:max_display], 1):
-        result += f"Match {i} at position {pos}:\n"
+        yield f"Match {i} at position {pos}:\n"
         
         # Show context
         context_start = max(0, pos - 10)
         context_end = min(len(seq), pos + len(pattern) + 10)
         context = seq[context_start:context_end]
         
-        result += f"  {context}\n"
+        yield f"  {context}\n"
         
         # Show pointer
         pointer_offset = pos - context_start
-        result += f"  {' ' * pointer_offset}{'^' * len(pattern)}\n\n"
+        yield f"  {' ' * pointer_offset}{'^' * len(pattern)}\n\n"
     
     if len(positions) > max_display:
-        result += f"... and {len(positions) - max_display} more matches\n"
-    
-    return result
\ No newline at end of file
+        yield f"... and {len(positions) - max_display} more matches\n"
@@ -1,40 +1,102 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - fall back to sorting in Python
+    np = None
+
+
 def build_suffix_array(text):
     if not text.endswith('$'):
         text = text + '$'
     
     text = text.upper()
-    n = len(text)
 
-    suffixes = []
-    for i in range(n):
-        suffixes.append((text[i:], i))
+    suffix_array = _prefix_doubling(text)
+    steps = [(text[pos:], pos) for pos in suffix_array]
+    
+    return suffix_array, steps
+
 
-    suffixes.sort()
+def _prefix_doubling(text):
+    """
+    Sort suffixes by prefix doubling (Manber-Myers) over integer ranks:
+    after each round, rank[i] orders suffix i by its first 2k characters.
+    A suffix running off the end ranks lowest, like a shorter string.
+    """
+    n = len(text)
+    if n < 2:
+        return list(range(n))
     
-    suffix_array = [pos for suffix, pos in suffixes]
-    steps = [(suffix, pos) for suffix, pos in suffixes]
+    if np is not None:
+        rank = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+        k = 1
+        while True:
+            second = np.full(n, -1, dtype=np.int64)
+            second[:n - k] = rank[k:]
+            sa = np.lexsort((second, rank))
+            first_sorted, second_sorted = rank[sa], second[sa]
+            changed = np.empty(n, dtype=np.int64)
+            changed[0] = 0
+            changed[1:] = ((first_sorted[1:] != first_sorted[:-1]) |
+                           (second_sorted[1:] != second_sorted[:-1]))
+            new_rank = np.cumsum(changed)
+            rank = np.empty(n, dtype=np.int64)
+            rank[sa] = new_rank
+            if new_rank[-1] == n - 1:
+                return sa.tolist()
+            k *= 2
     
-    return suffix_array, steps
+    rank = [ord(c) for c in text]
+    sa = list(range(n))
+    k = 1
+    while True:
+        key = [(rank[i], rank[i + k] if i + k < n else -1) for i in range(n)]
+        sa.sort(key=key.__getitem__)
+        new_rank = [0] * n
+        r = 0
+        for prev, pos in zip(sa, sa[1:]):
+            if key[pos] != key[prev]:
+                r += 1
+            new_rank[pos] = r
+        rank = new_rank
+        if r == n - 1:
+            return sa
+        k *= 2
 
 
 def format_suffix_array(text, suffix_array, steps):
-    result = "All Suffixes (sorted lexicographically):\n\n"
-    result += f"{'Index':<8s} {'Suffix':<30s}\n"
-    result += "-" * 40 + "\n"
+    out = ["All Suffixes (sorted lexicographically):\n\n",
+           f"{'Index':<8s} {'Suffix':<30s}\n",
+           "-" * 40 + "\n"]
     
     for suffix, pos in steps:
         display_suffix = suffix if len(suffix) <= 25 else suffix[:25] + "..."
-        result += f"{pos:<8d} {display_suffix}\n"
+        out.append(f"{pos:<8d} {display_suffix}\n")
     
-    result += "\n"
-    result += f"Suffix Array: {suffix_array}\n"
+    out.append("\n")
+    out.append(f"Suffix Array: {suffix_array}\n")
     
-    return result
+    return "".join(out)
 
 
 def search_suffix_array(text, suffix_array, pattern):
-    matches = []
-    for pos in suffix_array:
-        if text[pos:].startswith(pattern):
-            matches.append(pos)
-    return sorted(matches)
+    # Suffixes starting with pattern form one contiguous run of the sorted
+    # array; find its bounds with two binary searches on the m-char prefix
+    m = len(pattern)
+    lo, hi = 0, len(suffix_array)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = suffix_array[mid]
+        if text[pos:pos + m] < pattern:
+            lo = mid + 1
+        else:
+            hi = mid
+    start = lo
+    hi = len(suffix_array)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = suffix_array[mid]
+        if text[pos:pos + m] <= pattern:
+            lo = mid + 1
+        else:
+            hi = mid
+    return sorted(suffix_array[start:lo])
@@ -1,12 +1,116 @@
 """
 Build Script for BioAnalyzer Pro
 Creates Windows executable using PyInstaller
+
+Rebuilds reuse PyInstaller's build/ cache and are skipped entirely when
+dist/.build_key matches the current sources; pass --clean (or delete the
+build/ folder) for a fresh build from scratch
+
+On CI, keep build/ and the pip cache between runs, e.g. GitHub Actions:
+
+    - uses: actions/cache@v4
+      with:
+        path: |
+          build
+          ~/.cache/pip
+        key: pyinstaller-${{ hashFiles('**/*.py', 'BioAnalyzerPro.spec') }}
 """
 
+import hashlib
 import os
 import subprocess
 import sys
 import shutil
+from pathlib import Path
+
+EXE_PATH = os.path.join('dist', 'BioAnalyzerPro.exe')
+
+# cache_key() of the sources dist/BioAnalyzerPro.exe was built from
+BUILD_KEY_PATH = os.path.join('dist', '.build_key')
+
+SPEC_CONTENT = """# -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
+
+block_cipher = None
+
+# DLLs UPX cannot shrink (already compressed, or broken by packing);
+# BUILD_FAST=1 skips UPX altogether for quick development builds
+UPX_EXCLUDE = [
+    'vcruntime140.dll',
+    'vcruntime140_1.dll',
+    'python3.dll',
+    'python%d%d.dll' % sys.version_info[:2],
+    'tcl86t.dll',
+    'tk86t.dll',
+]
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    # algorithms/, ui/ and config.py are found by import analysis; bundling
+    # them again as data only adds files to classify and copy
+    datas=[],
+    hiddenimports=[
+        'tkinter',
+        'tkinter.ttk',
+        'tkinter.scrolledtext',
+        'tkinter.filedialog',
+        'tkinter.messagebox',
+        # main.py imports these lazily by name
+        'algorithms.fasta_parser',
+        'algorithms.dna_operations',
+        'algorithms.pattern_matching',
+        'algorithms.index_search',
+        'algorithms.suffix_array',
+        'algorithms.assembly',
+        'algorithms.edit_distance',
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+# Resolve the icon with a single stat when the spec is loaded (any
+# existing file counts, as with os.path.exists)
+try:
+    os.stat('assets/icon.ico')
+    _ICON = 'assets/icon.ico'
+except OSError:
+    _ICON = None
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='BioAnalyzerPro',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=not os.environ.get('BUILD_FAST'),
+    upx_exclude=UPX_EXCLUDE,
+    runtime_tmpdir=None,
+    console=False,  # No console window
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=_ICON,
+)
+"""
+
 
 def print_header(text):
     """Print formatted header"""
@@ -39,6 +143,24 @@ def install_pyinstaller():
         return False
 
 
+def ensure_fast_pefile():
+    """Avoid the pefile release that makes PyInstaller's Windows binary scan crawl"""
+    if sys.platform != 'win32':
+        return
+    try:
+        from importlib.metadata import version
+        if version('pefile') != '2024.8.26':
+            return
+    except Exception:
+        return
+    print("📦 Replacing slow pefile 2024.8.26...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "pefile!=2024.8.26"])
+        print("  ✓ pefile updated\n")
+    except Exception:
+        print("  ⚠️  Could not update pefile - the build will be slower\n")
+
+
 def check_required_files():
     """Check if all required files exist"""
     print("📋 Checking required files...")
@@ -55,9 +177,19 @@ def check_required_files():
         'algorithms/assembly.py': 'Assembly algorithms',
     }
     
+    # List each folder once instead of checking every file separately
+    present = set()
+    for folder in {os.path.dirname(file) for file in required}:
+        try:
+            with os.scandir(folder or '.') as entries:
+                present.update(os.path.join(folder, e.name).replace(os.sep, '/')
+                               for e in entries if e.is_file())
+        except OSError:
+            pass
+    
     missing = []
     for file, desc in required.items():
-        if os.path.exists(file):
+        if file in present:
             print(f"  ✓ {desc}: {file}")
         else:
             print(f"  ✗ Missing: {file}")
@@ -71,65 +203,9 @@ def create_spec_file():
     """Create PyInstaller spec file"""
     print("📝 Creating spec file...")
     
-    spec_content = """# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['main.py'],
-    pathex=[],
-    binaries=[],
-    datas=[
-        ('algorithms', 'algorithms'),
-        ('ui', 'ui'),
-        ('config.py', '.'),
-    ],
-    hiddenimports=[
-        'tkinter',
-        'tkinter.ttk',
-        'tkinter.scrolledtext',
-        'tkinter.filedialog',
-        'tkinter.messagebox',
-    ],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='BioAnalyzerPro',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,  # No console window
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='assets/icon.ico' if os.path.exists('assets/icon.ico') else None,
-)
-"""
-    
     try:
-        with open('BioAnalyzerPro.spec', 'w') as f:
-            f.write(spec_content)
+        # Encoded explicitly: one write, same bytes on every OS and locale
+        Path('BioAnalyzerPro.spec').write_bytes(SPEC_CONTENT.encode('utf-8'))
         print("  ✓ Spec file created: BioAnalyzerPro.spec\n")
         return True
     except Exception as e:
@@ -137,20 +213,73 @@ exe = EXE(
         return False
 
 
-def build_executable():
-    """Build the executable"""
+def cache_key():
+    """Hash of the spec template, app sources, assets and build toolchain;
+    changes whenever a rebuild is needed"""
+    import PyInstaller
+    
+    key = hashlib.blake2b(SPEC_CONTENT.encode('utf-8'))
+    # A different Python or PyInstaller produces a different executable
+    key.update(sys.version.encode('utf-8'))
+    key.update(PyInstaller.__version__.encode('utf-8'))
+    
+    files = ['main.py', 'config.py']
+    # assets/ holds the icon the spec embeds in the executable
+    for folder in ('algorithms', 'ui', 'assets'):
+        for root, dirs, names in os.walk(folder):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            files.extend(os.path.join(root, name) for name in sorted(names)
+                         if not name.endswith('.pyc'))
+    
+    for path in files:
+        key.update(path.replace(os.sep, '/').encode('utf-8'))
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                key.update(block)
+    return key.hexdigest()
+
+
+def build_executable(clean=False):
+    """Build the executable (clean=True discards PyInstaller's cache first)"""
     print("🔨 Building executable...")
+    
+    key = cache_key()
+    if not clean and os.path.exists(EXE_PATH):
+        try:
+            with open(BUILD_KEY_PATH) as f:
+                if f.read().strip() == key:
+                    print("  ✓ Sources unchanged - existing executable is up to date\n")
+                    return True
+        except OSError:
+            pass
+    
     print("This may take several minutes...\n")
     
+    # Without --clean, unchanged modules are reused from the build/ cache
+    args = ['pyinstaller', '--noconfirm', 'BioAnalyzerPro.spec']
+    if clean:
+        args.insert(1, '--clean')
+    # Let CI point at its own UPX install
+    if os.environ.get('UPX_DIR'):
+        args[1:1] = ['--upx-dir', os.environ['UPX_DIR']]
+    
+    # Keep PyInstaller's binary cache next to build/ so it survives between
+    # builds and is isolated from other projects
+    env = dict(os.environ)
+    env.setdefault('PYINSTALLER_CONFIG_DIR', os.path.abspath(os.path.join('build', 'pyinstaller-config')))
+    
     try:
         # Use the spec file
         result = subprocess.run(
-            ['pyinstaller', '--clean', 'BioAnalyzerPro.spec'],
+            args,
             capture_output=True,
-            text=True
+            text=True,
+            env=env
         )
         
         if result.returncode == 0:
+            with open(BUILD_KEY_PATH, 'w') as f:
+                f.write(key)
             print("  ✓ Build completed successfully!\n")
             return True
         else:
@@ -163,16 +292,55 @@ def build_executable():
         return False
 
 
+def link_tree(src, dst):
+    """
+    Mirror src into dst, hard-linking files where the filesystem allows it
+    (copying otherwise) and leaving files that are already up to date alone
+    """
+    os.makedirs(dst, exist_ok=True)
+    names = set()
+    
+    with os.scandir(src) as entries:
+        for entry in entries:
+            names.add(entry.name)
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                link_tree(entry.path, target)
+                continue
+            
+            src_stat = entry.stat()
+            try:
+                dst_stat = os.stat(target)
+                if (dst_stat.st_size == src_stat.st_size and
+                        dst_stat.st_mtime >= src_stat.st_mtime):
+                    continue
+                os.remove(target)
+            except FileNotFoundError:
+                pass
+            
+            try:
+                os.link(entry.path, target)
+            except OSError:
+                # Cross-device, or no hard-link support/permission
+                shutil.copy2(entry.path, target, follow_symlinks=False)
+    
+    # Drop anything no longer in src, as a fresh copy would
+    with os.scandir(dst) as entries:
+        for entry in entries:
+            if entry.name not in names:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
+
+
 def copy_assets():
     """Copy assets folder to dist"""
     print("📁 Copying assets...")
     
     if os.path.exists('assets'):
         try:
-            dist_assets = os.path.join('dist', 'assets')
-            if os.path.exists(dist_assets):
-                shutil.rmtree(dist_assets)
-            shutil.copytree('assets', dist_assets)
+            link_tree('assets', os.path.join('dist', 'assets'))
             print("  ✓ Assets copied to dist/\n")
             return True
         except Exception as e:
@@ -231,8 +399,8 @@ Built with Python and Tkinter
 """
     
     try:
-        with open('dist/README.txt', 'w') as f:
-            f.write(readme)
+        # CRLF line endings for Notepad, whatever OS runs the build
+        Path('dist/README.txt').write_bytes(readme.replace('\n', '\r\n').encode('utf-8'))
         print("  ✓ README created in dist/\n")
         return True
     except Exception as e:
@@ -240,7 +408,7 @@ Built with Python and Tkinter
         return False
 
 
-def main():
+def main(clean=False):
     """Main build process"""
     print_header("🧬 BioAnalyzer Pro - Build Script")
     
@@ -250,6 +418,8 @@ def main():
             print("❌ Cannot proceed without PyInstaller")
             return False
     
+    ensure_fast_pefile()
+    
     # Step 2: Check required files
     files_ok, missing = check_required_files()
     if not files_ok:
@@ -265,7 +435,7 @@ def main():
         return False
     
     # Step 4: Build executable
-    if not build_executable():
+    if not build_executable(clean):
         print("❌ Build failed")
         return False
     
@@ -301,7 +471,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        success = main()
+        success = main(clean='--clean' in sys.argv[1:])
         if success:
             input("\n✅ Press Enter to exit...")
         else:
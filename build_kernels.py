@@ -0,0 +1,30 @@
+"""
+Build Script for the optional compiled kernels
+Compiles algorithms/_kernels.pyx in place with Cython
+
+Usage: python build_kernels.py
+"""
+
+import sys
+
+
+def main():
+    """Compile the kernels extension next to its .pyx"""
+    try:
+        from Cython.Build import cythonize
+        from setuptools import setup
+    except ImportError:
+        print("✗ Cython and setuptools are required: pip install cython setuptools")
+        return False
+
+    setup(
+        name="bioanalyzer-kernels",
+        ext_modules=cythonize("algorithms/_kernels.pyx"),
+        script_args=["build_ext", "--inplace"],
+    )
+    print("✓ Built algorithms/_kernels")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -39,12 +39,14 @@ class Settings:
     WINDOW_SIZE = "1200x800"
     MIN_SIZE = (1000, 700)
     
-    TABS = {
-        'fasta': '📁 FASTA Parser',
-        'dna': '🧬 DNA Analysis',
-        'naive': '🔍 Naive Search',
-        'boyer': '⚡ Boyer-Moore',
-        'index': '📇 Index Search',
-        'suffix': '🔤 Suffix Array',
-        'assembly': '🧩 Assembly'
-    }
\ No newline at end of file
+    # (key, label) pairs in notebook order
+    TABS = (
+        ('fasta', '📁 FASTA Parser'),
+        ('dna', '🧬 DNA Analysis'),
+        ('naive', '🔍 Naive Search'),
+        ('boyer', '⚡ Boyer-Moore'),
+        ('index', '📇 Index Search'),
+        ('suffix', '🔤 Suffix Array'),
+        ('assembly', '🧩 Assembly'),
+        ('edit', '🧬 Edit Distance'),
+    )
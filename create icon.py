@@ -4,7 +4,10 @@ Creates a colorful DNA helix icon for BioAnalyzer Pro
 """
 
 from PIL import Image, ImageDraw
-import math
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import numpy as np
+import os
 
 def create_dna_helix_icon(size=256):
     """
@@ -34,77 +37,60 @@ def create_dna_helix_icon(size=256):
     ]
     
     # Calculate points for two helices
-    left_helix = []
-    right_helix = []
     total_points = num_turns * points_per_turn
-    
-    for i in range(total_points):
-        t = (i / total_points) * num_turns * 2 * math.pi
-        y = start_y + (i / total_points) * helix_height
-        
-        # Left helix (cos wave)
-        x_left = center_x + math.cos(t) * (helix_width / 2)
-        left_helix.append((x_left, y))
-        
-        # Right helix (cos wave shifted by pi)
-        x_right = center_x + math.cos(t + math.pi) * (helix_width / 2)
-        right_helix.append((x_right, y))
+    frac = np.arange(total_points) / total_points
+    t = frac * num_turns * 2 * np.pi
+    y = start_y + frac * helix_height
+    
+    # Left helix (cos wave), right helix (cos wave shifted by pi)
+    x_left = center_x + np.cos(t) * (helix_width / 2)
+    x_right = center_x + np.cos(t + np.pi) * (helix_width / 2)
+    left_helix = list(zip(x_left.tolist(), y.tolist()))
+    right_helix = list(zip(x_right.tolist(), y.tolist()))
+    
+    # Gradient color of each point: interpolate between neighbouring colors
+    position = frac * (len(colors) - 1)
+    color_index = position.astype(int)
+    blend = (position - color_index)[:, None]
+    palette = np.array(colors, dtype=float)
+    rgb = (palette[color_index] * (1 - blend) +
+           palette[np.minimum(color_index + 1, len(colors) - 1)] * blend).astype(int)
+    point_colors = [(r, g, b, 255) for r, g, b in rgb.tolist()]
     
     # Draw connecting lines between helices
     for i in range(0, len(left_helix), 4):
-        # Calculate color based on position
-        color_index = int((i / len(left_helix)) * (len(colors) - 1))
-        color1 = colors[color_index]
-        color2 = colors[min(color_index + 1, len(colors) - 1)]
-        
-        # Interpolate color
-        t = (i / len(left_helix)) * (len(colors) - 1) - color_index
-        r = int(color1[0] * (1 - t) + color2[0] * t)
-        g = int(color1[1] * (1 - t) + color2[1] * t)
-        b = int(color1[2] * (1 - t) + color2[2] * t)
-        color = (r, g, b, 255)
+        color = point_colors[i]
         
         # Draw connection line
         line_width = max(2, size // 64)
         draw.line([left_helix[i], right_helix[i]], fill=color, width=line_width)
     
-    # Draw helix strands
+    # Draw helix strands: both strands go into a mask as one polyline each,
+    # then a vertical gradient is pasted through it (segment i runs from
+    # point i to point i + 1 and takes point i's color, so color depends on y)
     strand_width = max(4, size // 32)
-    
-    for i in range(len(left_helix) - 1):
-        # Calculate color gradient
-        color_index = int((i / len(left_helix)) * (len(colors) - 1))
-        color1 = colors[color_index]
-        color2 = colors[min(color_index + 1, len(colors) - 1)]
-        
-        t = (i / len(left_helix)) * (len(colors) - 1) - color_index
-        r = int(color1[0] * (1 - t) + color2[0] * t)
-        g = int(color1[1] * (1 - t) + color2[1] * t)
-        b = int(color1[2] * (1 - t) + color2[2] * t)
-        color = (r, g, b, 255)
-        
-        # Draw left helix
-        draw.line([left_helix[i], left_helix[i + 1]], fill=color, width=strand_width)
-        
-        # Draw right helix
-        draw.line([right_helix[i], right_helix[i + 1]], fill=color, width=strand_width)
-        
-        # Draw circles at connection points for better look
-        if i % 4 == 0:
-            circle_size = max(3, size // 48)
-            draw.ellipse([
-                left_helix[i][0] - circle_size,
-                left_helix[i][1] - circle_size,
-                left_helix[i][0] + circle_size,
-                left_helix[i][1] + circle_size
-            ], fill=color)
-            
-            draw.ellipse([
-                right_helix[i][0] - circle_size,
-                right_helix[i][1] - circle_size,
-                right_helix[i][0] + circle_size,
-                right_helix[i][1] + circle_size
-            ], fill=color)
+    mask = Image.new('L', (size, size), 0)
+    mask_draw = ImageDraw.Draw(mask)
+    mask_draw.line(left_helix, fill=255, width=strand_width, joint='curve')
+    mask_draw.line(right_helix, fill=255, width=strand_width, joint='curve')
+    
+    segment = np.clip(np.searchsorted(y, np.arange(size), side='right') - 1,
+                      0, total_points - 2)
+    gradient = np.empty((size, size, 4), dtype=np.uint8)
+    gradient[:, :, :3] = rgb[segment][:, None, :]
+    gradient[:, :, 3] = 255
+    img.paste(Image.fromarray(gradient, 'RGBA'), (0, 0), mask)
+    
+    # Draw circles at connection points for better look: rasterize one
+    # circle mask and stamp each node's color through it
+    circle_size = max(3, size // 48)
+    diameter = 2 * circle_size + 1
+    stamp = Image.new('L', (diameter, diameter), 0)
+    ImageDraw.Draw(stamp).ellipse([0, 0, diameter - 1, diameter - 1], fill=255)
+    for i in range(0, total_points - 1, 4):
+        for x_node, y_node in (left_helix[i], right_helix[i]):
+            img.paste(point_colors[i], (round(x_node) - circle_size,
+                                        round(y_node) - circle_size), stamp)
     
     return img
 
@@ -133,40 +119,53 @@ def create_simple_dna_icon(size=64):
     
     segment_height = helix_height // num_segments
     
+    # Loop-invariant geometry and per-segment colors
+    x_left = center_x - helix_width // 2
+    x_right = center_x + helix_width // 2
+    line_width = max(2, size // 16)
+    half_width = line_width // 2
+    x_mid = (x_left + x_right) // 2
+    colors_rgba = [c + (255,) for c in colors]
+    color_by_segment = [colors_rgba[int((i / num_segments) * (len(colors) - 1))]
+                        for i in range(num_segments)]
+    
     for i in range(num_segments):
         y_top = start_y + i * segment_height
         y_bottom = y_top + segment_height
         
         # Alternate left and right
         if i % 2 == 0:
-            x_left_top = center_x - helix_width // 2
-            x_right_top = center_x + helix_width // 2
-            x_left_bottom = center_x + helix_width // 2
-            x_right_bottom = center_x - helix_width // 2
+            x_top, x_bottom = x_left, x_right
         else:
-            x_left_top = center_x + helix_width // 2
-            x_right_top = center_x - helix_width // 2
-            x_left_bottom = center_x - helix_width // 2
-            x_right_bottom = center_x + helix_width // 2
+            x_top, x_bottom = x_right, x_left
         
-        # Color based on position
-        color_idx = int((i / num_segments) * (len(colors) - 1))
-        color = colors[color_idx] + (255,)
+        color = color_by_segment[i]
         
-        # Draw strands
-        line_width = max(2, size // 16)
-        draw.line([(x_left_top, y_top), (x_left_bottom, y_bottom)], fill=color, width=line_width)
-        draw.line([(x_right_top, y_top), (x_right_bottom, y_bottom)], fill=color, width=line_width)
+        # Draw strands (they cross, so the second one runs mirrored)
+        draw.line([(x_top, y_top), (x_bottom, y_bottom)], fill=color, width=line_width)
+        draw.line([(x_bottom, y_top), (x_top, y_bottom)], fill=color, width=line_width)
         
-        # Draw connection
+        # Draw connection (both strands cross at the midpoint)
         y_mid = (y_top + y_bottom) // 2
-        x_left_mid = (x_left_top + x_left_bottom) // 2
-        x_right_mid = (x_right_top + x_right_bottom) // 2
-        draw.line([(x_left_mid, y_mid), (x_right_mid, y_mid)], fill=color, width=line_width // 2)
+        draw.line([(x_mid, y_mid), (x_mid, y_mid)], fill=color, width=half_width)
     
     return img
 
 
+def render_icon(size):
+    """Render the icon for one size; returns (size, PNG bytes)"""
+    if size <= 64:
+        # Use simplified version for small sizes
+        icon = create_simple_dna_icon(size)
+    else:
+        # Use detailed version for larger sizes
+        icon = create_dna_helix_icon(size)
+    
+    buf = BytesIO()
+    icon.save(buf, format='PNG')
+    return size, buf.getvalue()
+
+
 def main():
     """Generate icon in multiple sizes"""
     print("🧬 Generating BioAnalyzer Pro Icons...")
@@ -174,28 +173,20 @@ def main():
     # Standard icon sizes
     sizes = [16, 32, 48, 64, 128, 256, 512]
     
+    # Each size renders independently, so spread them over all cores
+    print(f"Creating {len(sizes)} icon sizes...")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        rendered = dict(pool.map(render_icon, sizes))
+    
     for size in sizes:
-        print(f"Creating {size}x{size} icon...")
-        
-        if size <= 64:
-            # Use simplified version for small sizes
-            icon = create_simple_dna_icon(size)
-        else:
-            # Use detailed version for larger sizes
-            icon = create_dna_helix_icon(size)
-        
         # Save as PNG
-        icon.save(f'/mnt/user-data/outputs/icon_{size}x{size}.png')
+        with open(f'/mnt/user-data/outputs/icon_{size}x{size}.png', 'wb') as f:
+            f.write(rendered[size])
         print(f"✓ Saved icon_{size}x{size}.png")
     
-    # Create main icon.ico with multiple sizes
+    # Create main icon.ico with multiple sizes from the rendered images
     print("\nCreating icon.ico with multiple resolutions...")
-    icons = []
-    for size in [16, 32, 48, 256]:
-        if size <= 64:
-            icons.append(create_simple_dna_icon(size))
-        else:
-            icons.append(create_dna_helix_icon(size))
+    icons = [Image.open(BytesIO(rendered[size])) for size in [16, 32, 48, 256]]
     
     icons[0].save('/mnt/user-data/outputs/icon.ico', 
                   format='ICO', 
@@ -203,10 +194,10 @@ def main():
                   append_images=icons[1:])
     print("✓ Saved icon.ico")
     
-    # Create logo for header (larger, horizontal)
+    # Create logo for header (same render as the 128px icon)
     print("\nCreating header logo...")
-    logo = create_dna_helix_icon(128)
-    logo.save('/mnt/user-data/outputs/logo.png')
+    with open('/mnt/user-data/outputs/logo.png', 'wb') as f:
+        f.write(rendered[128])
     print("✓ Saved logo.png")
     
     print("\n✅ All icons generated successfully!")
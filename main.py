@@ -1,183 +1,130 @@
 """
 BioAnalyzer Pro - Main Application
 Complete Bioinformatics Desktop Tool
-All 8 Tabs - WITH EDIT DISTANCE (EMBEDDED)
+All 8 Tabs - WITH EDIT DISTANCE
 """
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import heapq
+import importlib
+import io
+import mmap
+import multiprocessing
 import sys
 import os
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import Colors, Fonts, Settings
 from ui.styles import setup_styles
+from ui.widgets import PlaceholderEntry, PlaceholderText
 
-import algorithms.fasta_parser as fasta
-import algorithms.dna_operations as dna
-import algorithms.pattern_matching as pattern
-import algorithms.index_search as index
-import algorithms.suffix_array as suffix
-import algorithms.assembly as assembly
 
+class _LazyModule:
+    """Module stand-in that imports the module on first attribute access,
+    so start-up does not pay for algorithms no handler has used yet"""
+    
+    def __init__(self, name):
+        self._name = name
+    
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
 
-# ============================================================================
-# EDIT DISTANCE FUNCTIONS (EMBEDDED) - NO SEPARATE FILE NEEDED
-# ============================================================================
 
-def edit_distance_DP(x, y):
-    """Calculate edit distance using Dynamic Programming"""
-    D = []
-    for i in range(len(x) + 1):
-        D.append([0] * (len(y) + 1))
-    
-    for i in range(len(x) + 1):
-        D[i][0] = i
-    
-    for i in range(len(y) + 1):
-        D[0][i] = i
-    
-    for i in range(1, len(x) + 1):
-        for j in range(1, len(y) + 1):
-            delta = 1 if x[i-1] != y[j-1] else 0
-            D[i][j] = min(
-                D[i-1][j-1] + delta,
-                D[i-1][j] + 1,
-                D[i][j-1] + 1
-            )
-    
-    return D[-1][-1]
+fasta = _LazyModule('algorithms.fasta_parser')
+dna = _LazyModule('algorithms.dna_operations')
+pattern = _LazyModule('algorithms.pattern_matching')
+index = _LazyModule('algorithms.index_search')
+suffix = _LazyModule('algorithms.suffix_array')
+assembly = _LazyModule('algorithms.assembly')
+edit = _LazyModule('algorithms.edit_distance')
 
+# Uploaded files are copied into the input widget this many bytes at a time
+UPLOAD_CHUNK_SIZE = 1 << 20
 
-def edit_distance_with_matrix(x, y):
-    """Calculate edit distance and return matrix"""
-    D = []
-    for i in range(len(x) + 1):
-        D.append([0] * (len(y) + 1))
-    
-    for i in range(len(x) + 1):
-        D[i][0] = i
-    
-    for i in range(len(y) + 1):
-        D[0][i] = i
-    
-    for i in range(1, len(x) + 1):
-        for j in range(1, len(y) + 1):
-            delta = 1 if x[i-1] != y[j-1] else 0
-            D[i][j] = min(
-                D[i-1][j-1] + delta,
-                D[i-1][j] + 1,
-                D[i][j-1] + 1
-            )
-    
-    return D[-1][-1], D
+# Only this much of a larger upload is shown in the input widget; parsing
+# still streams the whole file from disk
+UPLOAD_PREVIEW_SIZE = 16 << 20
 
+# Parsed FASTA records listed individually in the results
+MAX_LISTED_SEQUENCES = 100
 
-def format_edit_distance_matrix(D, x, y):
-    """Format DP matrix for display"""
-    result = []
-    header = "      " + "  ".join([" "] + list(y))
-    result.append(header)
-    result.append("-" * len(header))
-    
-    for i in range(len(x) + 1):
-        row_label = " " if i == 0 else x[i-1]
-        row = f"{row_label:2} | " + "  ".join(f"{D[i][j]:2}" for j in range(len(y) + 1))
-        result.append(row)
-    
-    return "\n".join(result)
+# How often (ms) the Tk loop checks whether a background job has finished
+JOB_POLL_MS = 50
 
+# Minimum time (ms) between status bar redraws (~30 per second)
+STATUS_FLUSH_MS = 33
 
-def traceback_alignment(x, y, D):
-    """Traceback to find alignment"""
-    i, j = len(x), len(y)
-    aligned_x, aligned_y, operations = [], [], []
-    
-    while i > 0 or j > 0:
-        if i > 0 and j > 0:
-            delta = 0 if x[i-1] == y[j-1] else 1
-            if D[i][j] == D[i-1][j-1] + delta:
-                operations.append('match' if delta == 0 else 'substitute')
-                aligned_x.append(x[i-1])
-                aligned_y.append(y[j-1])
-                i -= 1
-                j -= 1
-            elif D[i][j] == D[i-1][j] + 1:
-                operations.append('delete')
-                aligned_x.append(x[i-1])
-                aligned_y.append('-')
-                i -= 1
-            else:
-                operations.append('insert')
-                aligned_x.append('-')
-                aligned_y.append(y[j-1])
-                j -= 1
-        elif i > 0:
-            operations.append('delete')
-            aligned_x.append(x[i-1])
-            aligned_y.append('-')
-            i -= 1
-        else:
-            operations.append('insert')
-            aligned_x.append('-')
-            aligned_y.append(y[j-1])
-            j -= 1
-    
-    aligned_x.reverse()
-    aligned_y.reverse()
-    operations.reverse()
-    
-    return ''.join(aligned_x), ''.join(aligned_y), operations
+# Results are inserted this many characters at a time, one chunk per idle
+# callback, so a long report shows its first page without waiting for the rest
+RESULT_CHUNK_SIZE = 1 << 16
 
+# Handler results kept for re-runs on unchanged input (oldest dropped first)
+RESULT_CACHE_SIZE = 16
 
-def format_alignment(aligned_x, aligned_y, operations):
-    """Format alignment for display"""
-    result = []
-    middle = []
-    for i in range(len(aligned_x)):
-        if operations[i] == 'match':
-            middle.append('|')
-        elif operations[i] == 'substitute':
-            middle.append('x')
-        elif operations[i] == 'delete':
-            middle.append('^')
-        else:
-            middle.append('v')
-    
-    result.append("Alignment:")
-    result.append(f"  {aligned_x}")
-    result.append(f"  {''.join(middle)}")
-    result.append(f"  {aligned_y}")
-    result.append("")
-    result.append("Legend: | = match, x = substitution, ^ = deletion, v = insertion")
-    
-    match_count = operations.count('match')
-    sub_count = operations.count('substitute')
-    del_count = operations.count('delete')
-    ins_count = operations.count('insert')
-    
-    result.append("")
-    result.append(f"Matches: {match_count}")
-    result.append(f"Substitutions: {sub_count}")
-    result.append(f"Deletions: {del_count}")
-    result.append(f"Insertions: {ins_count}")
-    
-    return "\n".join(result)
+# Index search patterns whose matches are kept for longer follow-up patterns
+SEARCH_CACHE_SIZE = 32
+
+# Valid edit-distance bases; bytes.translate deleting these leaves only the
+# invalid ones, in one C pass instead of a per-character set lookup
+DNA_BASES = b'ACGT'
 
-# ============================================================================
-# END OF EDIT DISTANCE FUNCTIONS
-# ============================================================================
+
+def content_key(*parts):
+    """Short digest of a handler's inputs, so cached results do not keep
+    another reference to (or re-hash) a whole sequence"""
+    h = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        data = part.encode('utf-8', 'surrogatepass') if isinstance(part, str) else repr(part).encode()
+        h.update(len(data).to_bytes(8, 'little'))
+        h.update(data)
+    return h.digest()
+
+
+def is_dna(seq):
+    """True if seq contains only A, C, G and T"""
+    return seq.isascii() and not seq.encode('ascii').translate(None, DNA_BASES)
 
 
 class BioAnalyzerApp:
     def __init__(self, root):
         self.root = root
+        # Handlers compute and format results here so the Tk loop stays responsive
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._jobs = set()  # submitted futures that have not finished
         self.setup_window()
         setup_styles()
         self.create_ui()
         self.current_index = None
         self.current_seq = None
+        self._search_cache = {}  # pattern -> positions in current_seq
+        self._upload_id = 0
+        self._results_cache = {}  # (handler, content_key) -> work result
+        self._canonical = {}  # Text widget -> its stripped, upper-cased sequence
+        self._sequence_lines = {}  # Text widget -> (canonical text, its lines)
+        self._pending_status = None
+        self._status_flush_id = None
+        self._status_shown_at = 0.0
+        self._fasta_source_path = None  # uploaded file, while the input is unedited
+        self._submit(self._warm_up_kernels)
+    
+    def _submit(self, fn):
+        """Run fn on the pool, tracked in _jobs until it finishes"""
+        future = self._pool.submit(fn)
+        self._jobs.add(future)
+        future.add_done_callback(self._jobs.discard)
+        return future
+    
+    def _warm_up_kernels(self):
+        """Compile the numba kernels before their first use; runs on the
+        pool, so the module imports stay off the Tk thread too"""
+        edit.warm_up()
+        pattern.warm_up()
     
     def setup_window(self):
         self.root.title(Settings.WINDOW_TITLE)
@@ -206,61 +153,214 @@ class BioAnalyzerApp:
                  font=Fonts.STATUS, bg=Colors.PRIMARY, fg=Colors.TEXT_LIGHT).pack(side='left')
     
     def create_all_tabs(self):
-        self.create_fasta_tab()
-        self.create_dna_tab()
-        self.create_naive_tab()
-        self.create_boyer_tab()
-        self.create_index_tab()
-        self.create_suffix_tab()
-        self.create_assembly_tab()
-        self.create_edit_distance_tab()  # NEW TAB
+        # Every tab gets its (empty) frame now so the notebook shows all
+        # labels; a tab's widgets are built the first time it is selected
+        builders = {
+            'fasta': self.create_fasta_tab,
+            'dna': self.create_dna_tab,
+            'naive': self.create_naive_tab,
+            'boyer': self.create_boyer_tab,
+            'index': self.create_index_tab,
+            'suffix': self.create_suffix_tab,
+            'assembly': self.create_assembly_tab,
+            'edit': self.create_edit_distance_tab,  # NEW TAB
+        }
+        self._pending_tabs = []
+        for key, label in Settings.TABS:
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=label)
+            self._pending_tabs.append((tab, builders[key]))
+        self.notebook.bind('<<NotebookTabChanged>>', self._build_selected_tab)
+        self._build_selected_tab()
+    
+    def _build_selected_tab(self, event=None):
+        """Build the selected tab's widgets if it has not been shown yet"""
+        current = self.notebook.index('current')
+        tab, build = self._pending_tabs[current]
+        if build is not None:
+            self._pending_tabs[current] = (tab, None)
+            build(tab)
+    
+    # Widget helpers shared by the tab builders
+    def _heading(self, tab, text, pady=(10, 5)):
+        tk.Label(tab, text=text, font=Fonts.HEADING,
+                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=pady)
+    
+    def _button(self, parent, text, command, style='Primary.TButton', padx=20, pady=10):
+        """Button in one of the styles from ui.styles (packed by the caller)"""
+        return ttk.Button(parent, text=text, command=command, style=style,
+                          padding=(padx, pady), cursor='hand2')
+    
+    def _row(self, tab, pady=10):
+        """Left-aligned frame for a row of buttons or parameters"""
+        frame = tk.Frame(tab, bg=Colors.WHITE)
+        frame.pack(anchor='w', padx=20, pady=pady)
+        return frame
+    
+    def _text_input(self, tab, height, placeholder, wrap='char'):
+        widget = PlaceholderText(tab, placeholder=placeholder, height=height,
+                                 font=Fonts.TEXT, bg=Colors.INPUT_BG, wrap=wrap)
+        widget.pack(fill='x', padx=20, pady=(5, 10))
+        return widget
+    
+    def _entry(self, tab, text=None, placeholder=None):
+        if placeholder is not None:
+            widget = PlaceholderEntry(tab, placeholder=placeholder, font=Fonts.TEXT, bg=Colors.INPUT_BG)
+        else:
+            widget = tk.Entry(tab, font=Fonts.TEXT, bg=Colors.INPUT_BG)
+        widget.pack(fill='x', padx=20, pady=(5, 10))
+        if text is not None:
+            widget.insert(0, text)
+        return widget
+    
+    def _results_box(self, tab, height, title="📊 Results", font=Fonts.TEXT):
+        self._heading(tab, title)
+        widget = scrolledtext.ScrolledText(tab, height=height, font=font,
+                                           bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
+        widget.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        return widget
     
     def update_status(self, message):
-        self.status_var.set(message)
-        self.root.update_idletasks()
+        """Show message in the status bar; bursts of updates are coalesced so
+        the bar redraws at most once per STATUS_FLUSH_MS, with the latest one"""
+        self._pending_status = message
+        if self._status_flush_id is not None:
+            return
+        wait = STATUS_FLUSH_MS - (time.monotonic() - self._status_shown_at) * 1000
+        if wait <= 0:
+            self._flush_status()
+        else:
+            self._status_flush_id = self.root.after(int(wait) + 1, self._flush_status)
     
-    # TAB 1: FASTA
-    def create_fasta_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text=Settings.TABS['fasta'])
-        
-        tk.Label(tab, text="📁 Input", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
-        
-        btn_frame = tk.Frame(tab, bg=Colors.WHITE)
-        btn_frame.pack(anchor='w', padx=20, pady=5)
-        
-        tk.Button(btn_frame, text="⬆ Upload FASTA File", command=self.upload_fasta,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(btn_frame, text="📝 Load Example", command=self.load_fasta_example,
-                  bg=Colors.WHITE, fg=Colors.SECONDARY, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=15, pady=8, cursor='hand2').pack(side='left')
-        
-        self.fasta_input = scrolledtext.ScrolledText(tab, height=6, font=Fonts.TEXT,
-                                                      bg=Colors.INPUT_BG, wrap='word')
-        self.fasta_input.pack(fill='x', padx=20, pady=(5, 10))
-        self.fasta_input.insert('1.0', "Paste FASTA formatted sequence here or upload file...")
-        
-        action_frame = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame.pack(anchor='w', padx=20, pady=10)
-        
-        tk.Button(action_frame, text="▶ Parse FASTA", command=self.parse_fasta,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(action_frame, text="🗑️ Clear",
-                  command=lambda: self.clear_tab(self.fasta_input, self.fasta_results),
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=20, pady=10, cursor='hand2').pack(side='left')
-        
-        tk.Label(tab, text="📊 Results", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
+    def _flush_status(self):
+        # No update_idletasks(): handlers return to the event loop straight
+        # away (the work runs on the pool), and Tk repaints the bar from there
+        self._status_flush_id = None
+        self.status_var.set(self._pending_status)
+        self._status_shown_at = time.monotonic()
+    
+    def run_in_background(self, button, work, on_done, on_error, key=None):
+        """
+        Run work() on the thread pool with button disabled
+        
+        Args:
+            button: Button to disable until the job finishes
+            work: Callable run off the Tk thread (must not touch widgets)
+            on_done: Called with work's result on the Tk thread
+            on_error: Called with the raised exception on the Tk thread
+            key: Cache key for the inputs of work; a result cached under
+                 it is reused instead of running work again
+        """
+        if key is not None and key in self._results_cache:
+            on_done(self._results_cache[key])
+            return
+        button.config(state='disabled')
+        future = self._submit(work)
+        self.root.after(JOB_POLL_MS, self._poll_job, future, button, on_done, on_error, key)
+    
+    def _poll_job(self, future, button, on_done, on_error, key):
+        """Hand a finished job's result back on the Tk thread (Tk is not thread-safe)"""
+        if not future.done():
+            self.root.after(JOB_POLL_MS, self._poll_job, future, button, on_done, on_error, key)
+            return
+        button.config(state='normal')
+        try:
+            result = future.result()
+        except Exception as e:
+            on_error(e)
+            return
+        if key is not None:
+            self._results_cache[key] = result
+            if len(self._results_cache) > RESULT_CACHE_SIZE:
+                del self._results_cache[next(iter(self._results_cache))]
+        on_done(result)
+    
+    def canonical_sequence(self, widget):
+        """
+        The widget's text stripped and upper-cased, recomputed only when
+        Tk's modified flag shows it was edited since the last call
+        
+        Args:
+            widget: Sequence input (Text)
+        """
+        if widget.edit_modified() or widget not in self._canonical:
+            self._canonical[widget] = widget.get('1.0', 'end-1c').strip().upper()
+            widget.edit_modified(False)
+        return self._canonical[widget]
+    
+    def sequence_lines(self, widget):
+        """
+        The widget's non-empty lines (one sequence per line) from
+        canonical_sequence, re-split only when that text changed
+        
+        Args:
+            widget: Sequences input (Text)
+        """
+        text = self.canonical_sequence(widget)
+        cached = self._sequence_lines.get(widget)
+        if cached is None or cached[0] is not text:
+            cached = self._sequence_lines[widget] = (
+                text, [s.strip() for s in text.split('\n') if s.strip()])
+        return cached[1]
+    
+    def show_results(self, output_widget, text, status):
+        """Replace the contents of a read-only results widget"""
+        # New token first, so chunks still queued for the previous result
+        # stop before anything below can let the idle queue run
+        output_widget.render_token = token = object()
+        output_widget.config(state='normal')
+        # One Tk call instead of a delete followed by an insert
+        output_widget.replace('1.0', 'end', text[:RESULT_CHUNK_SIZE])
+        output_widget.config(state='disabled')
+        self.update_status(status)
         
-        self.fasta_results = scrolledtext.ScrolledText(tab, height=12, font=Fonts.TEXT,
-                                                        bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.fasta_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        if len(text) > RESULT_CHUNK_SIZE:
+            self.root.after_idle(self._insert_result_chunk, output_widget, text,
+                                 RESULT_CHUNK_SIZE, token)
+    
+    def _insert_result_chunk(self, output_widget, text, offset, token):
+        """Append the next chunk of a long result, yielding to the event loop in between"""
+        if output_widget.render_token is not token:  # replaced or cleared since
+            return
+        output_widget.config(state='normal')
+        output_widget.insert('end', text[offset:offset + RESULT_CHUNK_SIZE])
+        output_widget.config(state='disabled')
+        offset += RESULT_CHUNK_SIZE
+        if offset < len(text):
+            self.root.after_idle(self._insert_result_chunk, output_widget, text, offset, token)
+    
+    def clear_output(self, output_widget):
+        """Empty a read-only results widget (and drop any result still being inserted)"""
+        output_widget.render_token = None
+        output_widget.config(state='normal')
+        output_widget.delete('1.0', 'end')
+        output_widget.config(state='disabled')
+    
+    def show_error(self, message, status):
+        messagebox.showerror("Error", message)
+        self.update_status(status)
+    
+    # TAB 1: FASTA
+    def create_fasta_tab(self, tab):
+        self._heading(tab, "📁 Input", pady=(20, 5))
+        
+        btn_frame = self._row(tab, pady=5)
+        self._button(btn_frame, "⬆ Upload FASTA File", self.upload_fasta,
+                     padx=15, pady=8).pack(side='left', padx=(0, 10))
+        self._button(btn_frame, "📝 Load Example", self.load_fasta_example,
+                     style='Highlight.Ghost.TButton', padx=15, pady=8).pack(side='left')
+        
+        self.fasta_input = self._text_input(
+            tab, 6, "Paste FASTA formatted sequence here or upload file...", wrap='word')
+        
+        action_frame = self._row(tab)
+        self.fasta_run_button = self._button(action_frame, "▶ Parse FASTA", self.parse_fasta)
+        self.fasta_run_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame, "🗑️ Clear",
+                     lambda: self.clear_tab(self.fasta_input, self.fasta_results),
+                     style='Ghost.TButton').pack(side='left')
+        
+        self.fasta_results = self._results_box(tab, 12)
     
     def upload_fasta(self):
         filepath = filedialog.askopenfilename(
@@ -268,14 +368,51 @@ class BioAnalyzerApp:
             filetypes=[("FASTA files", "*.fasta *.fa *.fna"), ("All files", "*.*")])
         if filepath:
             try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
+                # Map the file instead of reading it into one big string;
+                # it is copied into the widget a chunk at a time below
+                fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+                try:
+                    mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ) if os.fstat(fd).st_size else b''
+                finally:
+                    os.close(fd)
                 self.fasta_input.delete('1.0', 'end')
-                self.fasta_input.insert('1.0', content)
-                self.update_status("File loaded successfully")
+                self.fasta_input.is_placeholder = False
+                self._upload_id += 1
+                self._fasta_source_path = None
+                # Universal newlines and UTF-8 sequences split across chunks,
+                # as text-mode open() would give
+                decoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder('utf-8')('replace'), translate=True)
+                self.update_status("Loading file...")
+                self.root.after_idle(self._insert_upload_chunk, filepath, mm, 0, decoder, self._upload_id)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
     
+    def _insert_upload_chunk(self, filepath, mm, offset, decoder, upload_id):
+        """Insert the next chunk of an uploaded file, yielding to the event loop in between"""
+        if upload_id != self._upload_id:  # superseded by a newer upload
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+            return
+        end = min(len(mm), UPLOAD_PREVIEW_SIZE)
+        chunk = mm[offset:min(offset + UPLOAD_CHUNK_SIZE, end)]
+        offset += len(chunk)
+        done = offset >= end
+        self.fasta_input.insert('end', decoder.decode(chunk, final=done))
+        if done:
+            truncated = end < len(mm)
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+            # Until the text is edited, parse_fasta can read the file itself
+            self._fasta_source_path = filepath
+            self.fasta_input.edit_modified(False)
+            if truncated:
+                self.update_status(f"File loaded (showing the first {UPLOAD_PREVIEW_SIZE >> 20} MB)")
+            else:
+                self.update_status("File loaded successfully")
+        else:
+            self.root.after_idle(self._insert_upload_chunk, filepath, mm, offset, decoder, upload_id)
+    
     def load_fasta_example(self):
         example = """>sequence_1_hemolytic
 ATGCGATCGATCGATCGCGATCGATCGATCGATC
@@ -283,382 +420,331 @@ ATGCGATCGATCGATCGCGATCGATCGATCGATC
 GCTAGCTAGCTAGCTAG"""
         self.fasta_input.delete('1.0', 'end')
         self.fasta_input.insert('1.0', example)
+        self.fasta_input.is_placeholder = False
         self.update_status("Example loaded")
     
     def parse_fasta(self):
-        content = self.fasta_input.get('1.0', 'end-1c')
-        
-        if not content or "Paste FASTA" in content:
-            messagebox.showwarning("Warning", "Please provide FASTA content")
-            return
+        # An unedited upload is streamed from disk instead of the widget text
+        source = None if self.fasta_input.edit_modified() else self._fasta_source_path
+        content = None
+        if source is None:
+            content = self.fasta_input.get('1.0', 'end-1c')
+            
+            if self.fasta_input.is_placeholder or not content:
+                messagebox.showwarning("Warning", "Please provide FASTA content")
+                return
         
         try:
-            self.update_status("Parsing FASTA...")
-            
-            sequences = fasta.parse_simple_fasta(content)
-            stats = fasta.get_fasta_stats(sequences)
-            
-            result = "=" * 60 + "\nFASTA PARSING RESULTS\n" + "=" * 60 + "\n\n"
-            result += f"Total Sequences: {stats['num_sequences']}\n"
-            result += f"Total Length: {stats['total_length']} bp\n"
-            result += f"Average Length: {stats['avg_length']:.1f} bp\n"
-            result += f"Min Length: {stats['min_length']} bp\n"
-            result += f"Max Length: {stats['max_length']} bp\n\n"
-            
-            for i, (header, seq) in enumerate(sequences, 1):
-                result += f"Sequence {i}:\nHeader: {header}\nLength: {len(seq)} bp\n"
-                result += f"Sequence: {seq[:60]}{'...' if len(seq) > 60 else ''}\n\n"
-            
-            self.fasta_results.config(state='normal')
-            self.fasta_results.delete('1.0', 'end')
-            self.fasta_results.insert('1.0', result)
-            self.fasta_results.config(state='disabled')
-            
-            self.update_status(f"✓ Parsed {len(sequences)} sequences")
-        except Exception as e:
-            messagebox.showerror("Error", f"Parsing failed:\n{str(e)}")
-            self.update_status("✗ Parsing failed")
+            if source is not None:
+                # A file is identified by its path and version rather than read here
+                st = os.stat(source)
+                key = ('fasta', content_key(source, st.st_size, st.st_mtime_ns))
+            else:
+                key = ('fasta', content_key(content))
+        except OSError:
+            key = None
+        
+        self.update_status("Parsing FASTA...")
+        self.run_in_background(
+            self.fasta_run_button,
+            lambda: self._fasta_report(source, content),
+            lambda result: self.show_results(self.fasta_results, *result),
+            lambda e: self.show_error(f"Parsing failed:\n{str(e)}", "✗ Parsing failed"),
+            key=key)
     
-    # TAB 2: DNA
-    def create_dna_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text=Settings.TABS['dna'])
-        
-        tk.Label(tab, text="📁 DNA Sequence", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
+    def _fasta_report(self, source, content):
+        """Parse FASTA from a file path or text; returns (results text, status)"""
+        if source is not None:
+            with open(source, 'rb', buffering=1 << 20) as f:
+                stats, sequences = fasta.summarize_fasta(
+                    fasta.parse_simple_fasta_stream(f), MAX_LISTED_SEQUENCES)
+            if not stats['num_sequences']:
+                raise ValueError(fasta.NO_SEQUENCES_MESSAGE)
+        else:
+            stats, sequences = fasta.summarize_fasta(
+                fasta.parse_simple_fasta(content), MAX_LISTED_SEQUENCES)
         
-        btn_frame = tk.Frame(tab, bg=Colors.WHITE)
-        btn_frame.pack(anchor='w', padx=20, pady=5)
+        parts = ["=" * 60 + "\nFASTA PARSING RESULTS\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Total Sequences: {stats['num_sequences']}\n")
+        parts.append(f"Total Length: {stats['total_length']} bp\n")
+        parts.append(f"Average Length: {stats['avg_length']:.1f} bp\n")
+        parts.append(f"Min Length: {stats['min_length']} bp\n")
+        parts.append(f"Max Length: {stats['max_length']} bp\n\n")
         
-        tk.Button(btn_frame, text="📝 Load Example", command=self.load_dna_example,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(side='left')
+        for i, (header, seq) in enumerate(sequences, 1):
+            parts.append(f"Sequence {i}:\nHeader: {header}\nLength: {len(seq)} bp\n")
+            parts.append(f"Sequence: {seq[:60]}{'...' if len(seq) > 60 else ''}\n\n")
         
-        self.dna_input = scrolledtext.ScrolledText(tab, height=5, font=Fonts.TEXT,
-                                                    bg=Colors.INPUT_BG, wrap='char')
-        self.dna_input.pack(fill='x', padx=20, pady=(5, 10))
-        self.dna_input.insert('1.0', "Paste DNA sequence here...")
+        if stats['num_sequences'] > len(sequences):
+            parts.append(f"... and {stats['num_sequences'] - len(sequences)} more sequences\n")
         
-        action_frame = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame.pack(anchor='w', padx=20, pady=10)
+        return ''.join(parts), f"✓ Parsed {stats['num_sequences']} sequences"
+    
+    # TAB 2: DNA
+    def create_dna_tab(self, tab):
+        self._heading(tab, "📁 DNA Sequence", pady=(20, 5))
         
-        tk.Button(action_frame, text="▶ Run Analysis", command=self.analyze_dna,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
+        btn_frame = self._row(tab, pady=5)
+        self._button(btn_frame, "📝 Load Example", self.load_dna_example,
+                     padx=15, pady=8).pack(side='left')
         
-        tk.Button(action_frame, text="🗑️ Clear",
-                  command=lambda: self.clear_tab(self.dna_input, self.dna_results),
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=20, pady=10, cursor='hand2').pack(side='left')
+        self.dna_input = self._text_input(tab, 5, "Paste DNA sequence here...")
         
-        tk.Label(tab, text="📊 Results", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
+        action_frame = self._row(tab)
+        self.dna_run_button = self._button(action_frame, "▶ Run Analysis", self.analyze_dna)
+        self.dna_run_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame, "🗑️ Clear",
+                     lambda: self.clear_tab(self.dna_input, self.dna_results),
+                     style='Ghost.TButton').pack(side='left')
         
-        self.dna_results = scrolledtext.ScrolledText(tab, height=12, font=Fonts.TEXT,
-                                                      bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.dna_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        self.dna_results = self._results_box(tab, 12)
     
     def load_dna_example(self):
         self.dna_input.delete('1.0', 'end')
         self.dna_input.insert('1.0', "ATGGCGTCGCTGTGGAGGCGATCGATCG")
+        self.dna_input.is_placeholder = False
         self.update_status("Example loaded")
     
     def analyze_dna(self):
-        seq = self.dna_input.get('1.0', 'end-1c').strip().upper()
-        if not seq or "Paste DNA" in seq:
+        seq = self.canonical_sequence(self.dna_input)
+        if self.dna_input.is_placeholder or not seq:
             messagebox.showwarning("Warning", "Please provide a DNA sequence")
             return
         
-        try:
-            self.update_status("Analyzing...")
-            result = "=" * 60 + "\nDNA SEQUENCE ANALYSIS\n" + "=" * 60 + "\n\n"
-            result += f"Input Sequence: {seq[:60]}{'...' if len(seq) > 60 else ''}\n"
-            result += f"Length: {len(seq)} bp\n\n"
-            result += f"GC Content: {dna.gc_content(seq):.2f}%\n"
-            result += f"AT Content: {dna.at_content(seq):.2f}%\n"
-            
-            comp = dna.complement(seq)
-            result += f"\nComplement: {comp[:60]}{'...' if len(comp) > 60 else ''}\n"
-            
-            rev_comp = dna.reverse_complement(seq)
-            result += f"Reverse Complement: {rev_comp[:60]}{'...' if len(rev_comp) > 60 else ''}\n"
-            
-            protein = dna.translate(seq)
-            result += f"\nTranslation: {protein[:60]}{'...' if len(protein) > 60 else ''}\n"
-            
-            self.dna_results.config(state='normal')
-            self.dna_results.delete('1.0', 'end')
-            self.dna_results.insert('1.0', result)
-            self.dna_results.config(state='disabled')
-            
-            self.update_status("✓ Analysis complete")
-        except Exception as e:
-            messagebox.showerror("Error", f"Analysis failed:\n{str(e)}")
-            self.update_status("✗ Analysis failed")
+        self.update_status("Analyzing...")
+        self.run_in_background(
+            self.dna_run_button,
+            lambda: self._dna_report(seq),
+            lambda result: self.show_results(self.dna_results, *result),
+            lambda e: self.show_error(f"Analysis failed:\n{str(e)}", "✗ Analysis failed"),
+            key=('dna', content_key(seq)))
     
-    # TAB 3: NAIVE
-    def create_naive_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text=Settings.TABS['naive'])
-        
-        tk.Label(tab, text="📁 Input Sequence", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
-        
-        tk.Button(tab, text="📝 Load Example", command=self.load_naive_example,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(anchor='w', padx=20, pady=5)
-        
-        self.naive_seq = scrolledtext.ScrolledText(tab, height=4, font=Fonts.TEXT,
-                                                    bg=Colors.INPUT_BG, wrap='char')
-        self.naive_seq.pack(fill='x', padx=20, pady=(5, 10))
-        self.naive_seq.insert('1.0', "Paste sequence here...")
-        
-        tk.Label(tab, text="🔍 Pattern to Search", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
+    def _dna_report(self, seq):
+        """Analyze a DNA sequence; returns (results text, status)"""
+        parts = ["=" * 60 + "\nDNA SEQUENCE ANALYSIS\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Input Sequence: {seq[:60]}{'...' if len(seq) > 60 else ''}\n")
+        parts.append(f"Length: {len(seq)} bp\n\n")
         
-        self.naive_pattern = tk.Entry(tab, font=Fonts.TEXT, bg=Colors.INPUT_BG)
-        self.naive_pattern.pack(fill='x', padx=20, pady=(5, 10))
+        analysis = dna.analyze_sequence(seq)
+        parts.append(f"GC Content: {analysis['gc_content']:.2f}%\n")
+        parts.append(f"AT Content: {analysis['at_content']:.2f}%\n")
         
-        action_frame = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame.pack(anchor='w', padx=20, pady=10)
+        comp = analysis['complement']
+        parts.append(f"\nComplement: {comp[:60]}{'...' if len(comp) > 60 else ''}\n")
         
-        tk.Button(action_frame, text="🔍 Run Naive Search", command=self.run_naive_search,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
+        rev_comp = analysis['reverse_complement']
+        parts.append(f"Reverse Complement: {rev_comp[:60]}{'...' if len(rev_comp) > 60 else ''}\n")
         
-        tk.Button(action_frame, text="🗑️ Clear",
-                  command=lambda: self.clear_tab(self.naive_seq, self.naive_results),
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=20, pady=10, cursor='hand2').pack(side='left')
+        protein = analysis['translation']
+        parts.append(f"\nTranslation: {protein[:60]}{'...' if len(protein) > 60 else ''}\n")
         
-        tk.Label(tab, text="📊 Results", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        self.naive_results = scrolledtext.ScrolledText(tab, height=12, font=Fonts.TEXT,
-                                                        bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.naive_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        return ''.join(parts), "✓ Analysis complete"
+    
+    # TAB 3: NAIVE
+    def create_naive_tab(self, tab):
+        self._heading(tab, "📁 Input Sequence", pady=(20, 5))
+        self._button(tab, "📝 Load Example", self.load_naive_example,
+                     padx=15, pady=8).pack(anchor='w', padx=20, pady=5)
+        self.naive_seq = self._text_input(tab, 4, "Paste sequence here...")
+        
+        self._heading(tab, "🔍 Pattern to Search")
+        self.naive_pattern = self._entry(tab)
+        
+        action_frame = self._row(tab)
+        self.naive_run_button = self._button(action_frame, "🔍 Run Naive Search", self.run_naive_search)
+        self.naive_run_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame, "🗑️ Clear",
+                     lambda: self.clear_tab(self.naive_seq, self.naive_results),
+                     style='Ghost.TButton').pack(side='left')
+        
+        self.naive_results = self._results_box(tab, 12)
     
     def load_naive_example(self):
         self.naive_seq.delete('1.0', 'end')
         self.naive_seq.insert('1.0', "ATGCGATCGATCGATCGATCGATCGATCG")
+        self.naive_seq.is_placeholder = False
         self.naive_pattern.delete(0, 'end')
         self.naive_pattern.insert(0, "GATC")
         self.update_status("Example loaded")
     
     def run_naive_search(self):
-        seq = self.naive_seq.get('1.0', 'end-1c').strip().upper()
+        seq = self.canonical_sequence(self.naive_seq)
         pat = self.naive_pattern.get().strip().upper()
         
-        if not seq or not pat or "Paste sequence" in seq:
+        if self.naive_seq.is_placeholder or not seq or not pat:
             messagebox.showwarning("Warning", "Please provide both sequence and pattern")
             return
         
-        try:
-            self.update_status("Searching...")
-            positions = pattern.naive_match(seq, pat)
-            
-            result = "=" * 60 + "\nNAIVE PATTERN SEARCH\n" + "=" * 60 + "\n\n"
-            result += f"Sequence Length: {len(seq)} bp\n"
-            result += f"Pattern: {pat}\nPattern Length: {len(pat)} bp\n\n"
-            
-            if positions:
-                result += f"✓ Found {len(positions)} match(es):\n\n"
-                result += pattern.format_match_results(seq, pat, positions)
-            else:
-                result += "✗ Pattern not found\n"
-            
-            self.naive_results.config(state='normal')
-            self.naive_results.delete('1.0', 'end')
-            self.naive_results.insert('1.0', result)
-            self.naive_results.config(state='disabled')
-            
-            self.update_status(f"✓ Found {len(positions)} matches" if positions else "✗ No matches")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            self.update_status("✗ Search failed")
+        self.update_status("Searching...")
+        self.run_in_background(
+            self.naive_run_button,
+            lambda: self._naive_report(seq, pat),
+            lambda result: self.show_results(self.naive_results, *result),
+            lambda e: self.show_error(str(e), "✗ Search failed"),
+            key=('naive', content_key(seq, pat)))
     
-    # TAB 4: BOYER-MOORE
-    def create_boyer_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text=Settings.TABS['boyer'])
-        
-        tk.Label(tab, text="📁 Input Sequence", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
-        
-        tk.Button(tab, text="📝 Load Example", command=self.load_boyer_example,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(anchor='w', padx=20, pady=5)
-        
-        self.boyer_seq = scrolledtext.ScrolledText(tab, height=4, font=Fonts.TEXT,
-                                                    bg=Colors.INPUT_BG, wrap='char')
-        self.boyer_seq.pack(fill='x', padx=20, pady=(5, 10))
-        self.boyer_seq.insert('1.0', "Paste sequence here...")
-        
-        tk.Label(tab, text="🔍 Pattern to Search", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        self.boyer_pattern = tk.Entry(tab, font=Fonts.TEXT, bg=Colors.INPUT_BG)
-        self.boyer_pattern.pack(fill='x', padx=20, pady=(5, 10))
-        
-        action_frame = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame.pack(anchor='w', padx=20, pady=10)
-        
-        tk.Button(action_frame, text="⚡ Run Boyer-Moore", command=self.run_boyer_search,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(action_frame, text="🗑️ Clear",
-                  command=lambda: self.clear_tab(self.boyer_seq, self.boyer_results),
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=20, pady=10, cursor='hand2').pack(side='left')
-        
-        tk.Label(tab, text="📊 Results", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
+    def _naive_report(self, seq, pat):
+        """Naive search for pat in seq; returns (results text, status)"""
+        positions = pattern.naive_match(seq, pat)
+        
+        parts = ["=" * 60 + "\nNAIVE PATTERN SEARCH\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Sequence Length: {len(seq)} bp\n")
+        parts.append(f"Pattern: {pat}\nPattern Length: {len(pat)} bp\n\n")
+        
+        # The textbook algorithm, step by step (the matches themselves come
+        # from naive_match's C substring search)
+        parts.append("How it works: the pattern is compared at every alignment\n")
+        parts.extend(pattern.iter_naive_steps(seq, pat))
+        parts.append("\n")
+        
+        if positions:
+            parts.append(f"✓ Found {len(positions)} match(es):\n\n")
+            parts.extend(pattern.iter_match_results(seq, pat, positions))
+        else:
+            parts.append("✗ Pattern not found\n")
         
-        self.boyer_results = scrolledtext.ScrolledText(tab, height=15, font=Fonts.TEXT,
-                                                        bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.boyer_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        return ''.join(parts), f"✓ Found {len(positions)} matches" if positions else "✗ No matches"
+    
+    # TAB 4: BOYER-MOORE
+    def create_boyer_tab(self, tab):
+        self._heading(tab, "📁 Input Sequence", pady=(20, 5))
+        self._button(tab, "📝 Load Example", self.load_boyer_example,
+                     padx=15, pady=8).pack(anchor='w', padx=20, pady=5)
+        self.boyer_seq = self._text_input(tab, 4, "Paste sequence here...")
+        
+        self._heading(tab, "🔍 Pattern to Search")
+        self.boyer_pattern = self._entry(tab)
+        
+        action_frame = self._row(tab)
+        self.boyer_run_button = self._button(action_frame, "⚡ Run Boyer-Moore", self.run_boyer_search)
+        self.boyer_run_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame, "🗑️ Clear",
+                     lambda: self.clear_tab(self.boyer_seq, self.boyer_results),
+                     style='Ghost.TButton').pack(side='left')
+        
+        self.boyer_results = self._results_box(tab, 15)
     
     def load_boyer_example(self):
         self.boyer_seq.delete('1.0', 'end')
         self.boyer_seq.insert('1.0', "ATGCGATCGATCGATCGATCGATCGATCG")
+        self.boyer_seq.is_placeholder = False
         self.boyer_pattern.delete(0, 'end')
         self.boyer_pattern.insert(0, "GATC")
         self.update_status("Example loaded")
     
     def run_boyer_search(self):
-        seq = self.boyer_seq.get('1.0', 'end-1c').strip().upper()
+        seq = self.canonical_sequence(self.boyer_seq)
         pat = self.boyer_pattern.get().strip().upper()
         
-        if not seq or not pat or "Paste sequence" in seq:
+        if self.boyer_seq.is_placeholder or not seq or not pat:
             messagebox.showwarning("Warning", "Please provide both sequence and pattern")
             return
         
-        try:
-            self.update_status("Running Boyer-Moore...")
-            positions, bc_table = pattern.boyer_moore_match(seq, pat)
-            
-            result = "=" * 60 + "\nBOYER-MOORE PATTERN SEARCH\n" + "=" * 60 + "\n\n"
-            result += f"Sequence Length: {len(seq)} bp\n"
-            result += f"Pattern: {pat}\nPattern Length: {len(pat)} bp\n\n"
-            result += "Bad Character Table:\n"
-            result += pattern.format_bad_char_table(bc_table, pat)
-            result += "\n"
-            
-            if positions:
-                result += f"✓ Found {len(positions)} match(es):\n\n"
-                result += pattern.format_match_results(seq, pat, positions)
-            else:
-                result += "✗ Pattern not found\n"
-            
-            self.boyer_results.config(state='normal')
-            self.boyer_results.delete('1.0', 'end')
-            self.boyer_results.insert('1.0', result)
-            self.boyer_results.config(state='disabled')
-            
-            self.update_status(f"✓ Found {len(positions)} matches" if positions else "✗ No matches")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            self.update_status("✗ Search failed")
+        self.update_status("Running Boyer-Moore...")
+        self.run_in_background(
+            self.boyer_run_button,
+            lambda: self._boyer_report(seq, pat),
+            lambda result: self.show_results(self.boyer_results, *result),
+            lambda e: self.show_error(str(e), "✗ Search failed"),
+            key=('boyer', content_key(seq, pat)))
     
-    # TAB 5: INDEX
-    def create_index_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text=Settings.TABS['index'])
-        
-        tk.Label(tab, text="📁 Input Sequence", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
-        
-        tk.Button(tab, text="📝 Load Example", command=self.load_index_example,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(anchor='w', padx=20, pady=5)
-        
-        self.index_seq = scrolledtext.ScrolledText(tab, height=4, font=Fonts.TEXT,
-                                                    bg=Colors.INPUT_BG, wrap='char')
-        self.index_seq.pack(fill='x', padx=20, pady=(5, 10))
-        self.index_seq.insert('1.0', "Paste sequence here...")
-        
-        tk.Label(tab, text="⚙️ K-mer Size", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        params_frame = tk.Frame(tab, bg=Colors.WHITE)
-        params_frame.pack(anchor='w', padx=20, pady=5)
+    def _boyer_report(self, seq, pat):
+        """Boyer-Moore search for pat in seq; returns (results text, status)"""
+        positions, _ = pattern.boyer_moore_match(seq, pat)
+        
+        parts = ["=" * 60 + "\nBOYER-MOORE PATTERN SEARCH\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Sequence Length: {len(seq)} bp\n")
+        parts.append(f"Pattern: {pat}\nPattern Length: {len(pat)} bp\n\n")
+        parts.append("Bad Character Table:\n")
+        parts.append(pattern.format_pattern_bad_char_table(pat))
+        parts.append("\n")
+        
+        if positions:
+            parts.append(f"✓ Found {len(positions)} match(es):\n\n")
+            parts.extend(pattern.iter_match_results(seq, pat, positions))
+        else:
+            parts.append("✗ Pattern not found\n")
         
+        return ''.join(parts), f"✓ Found {len(positions)} matches" if positions else "✗ No matches"
+    
+    # TAB 5: INDEX
+    def create_index_tab(self, tab):
+        self._heading(tab, "📁 Input Sequence", pady=(20, 5))
+        self._button(tab, "📝 Load Example", self.load_index_example,
+                     padx=15, pady=8).pack(anchor='w', padx=20, pady=5)
+        self.index_seq = self._text_input(tab, 4, "Paste sequence here...")
+        
+        self._heading(tab, "⚙️ K-mer Size")
+        params_frame = self._row(tab, pady=5)
         tk.Label(params_frame, text="K-mer length:", font=Fonts.LABEL,
                  bg=Colors.WHITE).pack(side='left', padx=(0, 10))
-        
         self.kmer_size = tk.Spinbox(params_frame, from_=2, to=10, width=10, font=Fonts.LABEL)
         self.kmer_size.delete(0, 'end')
         self.kmer_size.insert(0, '3')
         self.kmer_size.pack(side='left')
         
-        action_frame1 = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame1.pack(anchor='w', padx=20, pady=10)
-        
-        tk.Button(action_frame1, text="🔨 Build Index", command=self.build_sequence_index,
-                  bg=Colors.ACCENT, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(action_frame1, text="🗑️ Clear", command=self.clear_index_tab,
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=20, pady=10, cursor='hand2').pack(side='left')
-        
-        tk.Label(tab, text="🔍 Search Pattern", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        self.index_pattern = tk.Entry(tab, font=Fonts.TEXT, bg=Colors.INPUT_BG)
-        self.index_pattern.pack(fill='x', padx=20, pady=(5, 10))
+        action_frame1 = self._row(tab)
+        self.index_build_button = self._button(action_frame1, "🔨 Build Index", self.build_sequence_index,
+                                               style='Accent.TButton')
+        self.index_build_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame1, "🗑️ Clear", self.clear_index_tab,
+                     style='Ghost.TButton').pack(side='left')
         
-        tk.Button(tab, text="🔍 Search in Index", command=self.search_in_index,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(anchor='w', padx=20, pady=10)
+        self._heading(tab, "🔍 Search Pattern")
+        self.index_pattern = self._entry(tab)
+        self.index_search_button = self._button(tab, "🔍 Search in Index", self.search_in_index)
+        self.index_search_button.pack(anchor='w', padx=20, pady=10)
         
-        tk.Label(tab, text="📊 Results", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        self.index_results = scrolledtext.ScrolledText(tab, height=12, font=Fonts.TEXT,
-                                                        bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.index_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        self.index_results = self._results_box(tab, 12)
     
     def load_index_example(self):
         self.index_seq.delete('1.0', 'end')
         self.index_seq.insert('1.0', "ATGCGATCGATCGATCGATCGATCGATCG")
+        self.index_seq.is_placeholder = False
         self.index_pattern.delete(0, 'end')
         self.index_pattern.insert(0, "GAT")
         self.update_status("Example loaded")
     
     def build_sequence_index(self):
-        seq = self.index_seq.get('1.0', 'end-1c').strip().upper()
-        if not seq or "Paste sequence" in seq:
+        seq = self.canonical_sequence(self.index_seq)
+        if self.index_seq.is_placeholder or not seq:
             messagebox.showwarning("Warning", "Please provide a sequence")
             return
         
         try:
             k = int(self.kmer_size.get())
-            self.update_status(f"Building {k}-mer index...")
-            
-            self.current_index = index.build_index(seq, k)
-            self.current_seq = seq
-            
-            stats = index.get_index_stats(self.current_index, seq, k)
-            
-            result = "=" * 60 + "\nINDEX BUILT SUCCESSFULLY\n" + "=" * 60 + "\n\n"
-            result += f"Sequence Length: {stats['sequence_length']} bp\n"
-            result += f"K-mer Size: {stats['k']}\n"
-            result += f"Unique K-mers: {stats['unique_kmers']}\n"
-            result += f"Total K-mers: {stats['total_kmers']}\n\n"
-            result += "K-mer Index Table:\n"
-            result += index.format_index_table(self.current_index)
-            
-            self.index_results.config(state='normal')
-            self.index_results.delete('1.0', 'end')
-            self.index_results.insert('1.0', result)
-            self.index_results.config(state='disabled')
-            
-            self.update_status("✓ Index built successfully")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to build index:\n{str(e)}")
-            self.update_status("✗ Index build failed")
+        except ValueError as e:
+            self.show_error(f"Failed to build index:\n{str(e)}", "✗ Index build failed")
+            return
+        
+        self.update_status(f"Building {k}-mer index...")
+        self.run_in_background(
+            self.index_build_button,
+            lambda: self._index_report(seq, k),
+            self._index_built,
+            lambda e: self.show_error(f"Failed to build index:\n{str(e)}", "✗ Index build failed"),
+            key=('index', content_key(seq, k)))
+    
+    def _index_report(self, seq, k):
+        """Build the k-mer index of seq; returns (index, seq, results text)"""
+        idx = index.build_index(seq, k)
+        stats = index.get_index_stats(idx, seq, k)
+        
+        parts = ["=" * 60 + "\nINDEX BUILT SUCCESSFULLY\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Sequence Length: {stats['sequence_length']} bp\n")
+        parts.append(f"K-mer Size: {stats['k']}\n")
+        parts.append(f"Unique K-mers: {stats['unique_kmers']}\n")
+        parts.append(f"Total K-mers: {stats['total_kmers']}\n\n")
+        parts.append("K-mer Index Table:\n")
+        parts.append(index.format_index_table(idx))
+        
+        return idx, seq, ''.join(parts)
+    
+    def _index_built(self, result):
+        # Only swap in the new index once it is complete
+        self.current_index, self.current_seq, text = result
+        self._search_cache = {}
+        self.show_results(self.index_results, text, "✓ Index built successfully")
     
     def search_in_index(self):
         if self.current_index is None:
@@ -670,89 +756,87 @@ GCTAGCTAGCTAGCTAG"""
             messagebox.showwarning("Warning", "Please provide a search pattern")
             return
         
-        try:
-            self.update_status("Searching in index...")
-            positions = index.query_index(self.current_index, self.current_seq, pat)
-            
-            result = "=" * 60 + "\nINDEX SEARCH RESULTS\n" + "=" * 60 + "\n\n"
-            result += f"Pattern: {pat}\nPattern Length: {len(pat)} bp\n\n"
-            
-            if positions:
-                result += f"✓ Found {len(positions)} match(es):\n\n"
-                for i, pos in enumerate(positions[:10], 1):
-                    context_start = max(0, pos - 10)
-                    context_end = min(len(self.current_seq), pos + len(pat) + 10)
-                    context = self.current_seq[context_start:context_end]
-                    result += f"Match {i} at position {pos}:\n  {context}\n"
-                    result += f"  {' ' * (pos - context_start)}{'^' * len(pat)}\n\n"
-                
-                if len(positions) > 10:
-                    result += f"... and {len(positions) - 10} more matches\n"
-            else:
-                result += "✗ Pattern not found in index\n"
-            
-            self.index_results.config(state='normal')
-            self.index_results.delete('1.0', 'end')
-            self.index_results.insert('1.0', result)
-            self.index_results.config(state='disabled')
-            
-            self.update_status(f"✓ Found {len(positions)} matches" if positions else "✗ No matches")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            self.update_status("✗ Search failed")
+        self.update_status("Searching in index...")
+        # The job keeps the index it was started on, even if a new one is
+        # built meanwhile
+        idx, seq, cache = self.current_index, self.current_seq, self._search_cache
+        self.run_in_background(
+            self.index_search_button,
+            lambda: self._index_search_report(idx, seq, cache, pat),
+            lambda result: self.show_results(self.index_results, *result),
+            lambda e: self.show_error(str(e), "✗ Search failed"))
+    
+    def _index_search_report(self, idx, seq, cache, pat):
+        """Search pat with the k-mer index idx of seq; returns (results text, status)"""
+        positions = self._query_index(idx, seq, cache, pat)
+        
+        parts = ["=" * 60 + "\nINDEX SEARCH RESULTS\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Pattern: {pat}\nPattern Length: {len(pat)} bp\n\n")
+        
+        if positions:
+            parts.append(f"✓ Found {len(positions)} match(es):\n\n")
+            # Only the displayed matches are sliced, ~len(pat) + 20 chars each
+            parts.extend(pattern.iter_match_results(seq, pat, positions))
+        else:
+            parts.append("✗ Pattern not found in index\n")
+        
+        return ''.join(parts), f"✓ Found {len(positions)} matches" if positions else "✗ No matches"
+    
+    def _query_index(self, idx, seq, cache, pat):
+        """Match positions of pat, narrowing an earlier search when one of its
+        patterns (in cache, for this idx) is a prefix of pat (its matches are
+        the only candidates)"""
+        positions = cache.get(pat)
+        if positions is not None:
+            return positions
+        
+        k = len(next(iter(idx), ''))
+        prefix = max((p for p in cache if len(p) >= k and pat.startswith(p)),
+                     key=len, default=None)
+        if k and prefix is not None:
+            positions = index.filter_matches(seq, pat, cache[prefix])
+        else:
+            positions = index.query_index(idx, seq, pat)
+        
+        cache[pat] = positions
+        if len(cache) > SEARCH_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return positions
     
     def clear_index_tab(self):
         self.index_seq.delete('1.0', 'end')
         self.index_pattern.delete(0, 'end')
-        self.index_results.config(state='normal')
-        self.index_results.delete('1.0', 'end')
-        self.index_results.config(state='disabled')
+        self.clear_output(self.index_results)
         self.current_index = None
         self.current_seq = None
+        self._search_cache = {}
         self.update_status("Cleared")
     
     # TAB 6: SUFFIX
-    def create_suffix_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text=Settings.TABS['suffix'])
-        
-        tk.Label(tab, text="📁 Input Sequence (max 20 chars)", 
-                 font=Fonts.HEADING, bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
-        
-        tk.Button(tab, text="📝 Load Example", command=self.load_suffix_example,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(anchor='w', padx=20, pady=5)
-        
-        self.suffix_seq = tk.Entry(tab, font=Fonts.TEXT, bg=Colors.INPUT_BG)
-        self.suffix_seq.pack(fill='x', padx=20, pady=(5, 10))
-        self.suffix_seq.insert(0, "Enter short sequence (e.g., BANANA)...")
-        
-        action_frame = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame.pack(anchor='w', padx=20, pady=10)
-        
-        tk.Button(action_frame, text="🔨 Build Suffix Array", command=self.build_suffix_array_viz,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(action_frame, text="🗑️ Clear", command=self.clear_suffix_tab,
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=20, pady=10, cursor='hand2').pack(side='left')
-        
-        tk.Label(tab, text="📊 Suffix Array Construction", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        self.suffix_results = scrolledtext.ScrolledText(tab, height=15, font=Fonts.TEXT,
-                                                         bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.suffix_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+    def create_suffix_tab(self, tab):
+        self._heading(tab, "📁 Input Sequence (max 20 chars)", pady=(20, 5))
+        self._button(tab, "📝 Load Example", self.load_suffix_example,
+                     padx=15, pady=8).pack(anchor='w', padx=20, pady=5)
+        self.suffix_seq = self._entry(tab, placeholder="Enter short sequence (e.g., BANANA)...")
+        
+        action_frame = self._row(tab)
+        self.suffix_run_button = self._button(action_frame, "🔨 Build Suffix Array",
+                                              self.build_suffix_array_viz)
+        self.suffix_run_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame, "🗑️ Clear", self.clear_suffix_tab,
+                     style='Ghost.TButton').pack(side='left')
+        
+        self.suffix_results = self._results_box(tab, 15, title="📊 Suffix Array Construction")
     
     def load_suffix_example(self):
         self.suffix_seq.delete(0, 'end')
         self.suffix_seq.insert(0, "BANANA")
+        self.suffix_seq.is_placeholder = False
         self.update_status("Example loaded")
     
     def build_suffix_array_viz(self):
         seq = self.suffix_seq.get().strip().upper()
-        if not seq or "Enter short" in seq:
+        if self.suffix_seq.is_placeholder or not seq:
             messagebox.showwarning("Warning", "Please provide a sequence")
             return
         
@@ -760,214 +844,173 @@ GCTAGCTAGCTAGCTAG"""
             messagebox.showwarning("Warning", "For visualization, please use sequences ≤ 20 characters")
             return
         
-        try:
-            self.update_status("Building suffix array...")
-            sa, steps = suffix.build_suffix_array(seq)
-            
-            result = "=" * 60 + "\nSUFFIX ARRAY CONSTRUCTION\n" + "=" * 60 + "\n\n"
-            result += f"Input Sequence: {seq}\nLength: {len(seq)}\n\n"
-            result += suffix.format_suffix_array(seq, sa, steps)
-            
-            self.suffix_results.config(state='normal')
-            self.suffix_results.delete('1.0', 'end')
-            self.suffix_results.insert('1.0', result)
-            self.suffix_results.config(state='disabled')
-            
-            self.update_status("✓ Suffix array built")
-        except Exception as e:
-            messagebox.showerror("Error", f"Build failed:\n{str(e)}")
-            self.update_status("✗ Build failed")
+        self.update_status("Building suffix array...")
+        self.run_in_background(
+            self.suffix_run_button,
+            lambda: self._suffix_report(seq),
+            lambda result: self.show_results(self.suffix_results, *result),
+            lambda e: self.show_error(f"Build failed:\n{str(e)}", "✗ Build failed"),
+            key=('suffix', content_key(seq)))
+    
+    def _suffix_report(self, seq):
+        """Suffix array of seq with its construction steps; returns (results text, status)"""
+        sa, steps = suffix.build_suffix_array(seq)
+        
+        parts = ["=" * 60 + "\nSUFFIX ARRAY CONSTRUCTION\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Input Sequence: {seq}\nLength: {len(seq)}\n\n")
+        parts.append(suffix.format_suffix_array(seq, sa, steps))
+        
+        return ''.join(parts), "✓ Suffix array built"
     
     def clear_suffix_tab(self):
         self.suffix_seq.delete(0, 'end')
-        self.suffix_results.config(state='normal')
-        self.suffix_results.delete('1.0', 'end')
-        self.suffix_results.config(state='disabled')
+        self.clear_output(self.suffix_results)
         self.update_status("Cleared")
     
     # TAB 7: ASSEMBLY (UPDATED FOR NEW DICTIONARY-BASED OVERLAPS)
-    def create_assembly_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text=Settings.TABS['assembly'])
-        
-        tk.Label(tab, text="📁 Input Sequences (one per line)", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
-        
-        tk.Button(tab, text="📝 Load Example", command=self.load_assembly_example,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(anchor='w', padx=20, pady=5)
-        
-        self.assembly_seqs = scrolledtext.ScrolledText(tab, height=6, font=Fonts.TEXT,
-                                                        bg=Colors.INPUT_BG, wrap='word')
-        self.assembly_seqs.pack(fill='x', padx=20, pady=(5, 10))
-        self.assembly_seqs.insert('1.0', "Paste sequences here (one per line)...")
-        
-        tk.Label(tab, text="⚙️ Parameters", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        params_frame = tk.Frame(tab, bg=Colors.WHITE)
-        params_frame.pack(anchor='w', padx=20, pady=5)
-        
+    def create_assembly_tab(self, tab):
+        self._heading(tab, "📁 Input Sequences (one per line)", pady=(20, 5))
+        self._button(tab, "📝 Load Example", self.load_assembly_example,
+                     padx=15, pady=8).pack(anchor='w', padx=20, pady=5)
+        self.assembly_seqs = self._text_input(
+            tab, 6, "Paste sequences here (one per line)...", wrap='word')
+        
+        self._heading(tab, "⚙️ Parameters")
+        params_frame = self._row(tab, pady=5)
         tk.Label(params_frame, text="Minimum Overlap:", font=Fonts.LABEL,
                  bg=Colors.WHITE).pack(side='left', padx=(0, 10))
-        
         self.min_overlap = tk.Spinbox(params_frame, from_=2, to=20, width=10, font=Fonts.LABEL)
         self.min_overlap.delete(0, 'end')
         self.min_overlap.insert(0, '3')
         self.min_overlap.pack(side='left')
         
-        action_frame = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame.pack(anchor='w', padx=20, pady=10)
-        
-        tk.Button(action_frame, text="🔍 Find Overlaps", command=self.find_overlaps,
-                  bg=Colors.ACCENT, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(action_frame, text="🧩 Greedy Assembly", command=self.run_greedy_assembly,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(action_frame, text="🗑️ Clear",
-                  command=lambda: self.clear_tab(self.assembly_seqs, self.assembly_results),
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=15, pady=10, cursor='hand2').pack(side='left')
-        
-        tk.Label(tab, text="📊 Results", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        self.assembly_results = scrolledtext.ScrolledText(tab, height=12, font=Fonts.TEXT,
-                                                           bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.assembly_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        action_frame = self._row(tab)
+        self.overlaps_button = self._button(action_frame, "🔍 Find Overlaps", self.find_overlaps,
+                                            style='Accent.TButton', padx=15)
+        self.overlaps_button.pack(side='left', padx=(0, 10))
+        self.assembly_button = self._button(action_frame, "🧩 Greedy Assembly",
+                                            self.run_greedy_assembly, padx=15)
+        self.assembly_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame, "🗑️ Clear",
+                     lambda: self.clear_tab(self.assembly_seqs, self.assembly_results),
+                     style='Ghost.TButton', padx=15).pack(side='left')
+        
+        self.assembly_results = self._results_box(tab, 12)
     
     def load_assembly_example(self):
         example = "ATGCGATCG\nTCGATCGAT\nATCGATCGC\nCGCTAGCTA"
         self.assembly_seqs.delete('1.0', 'end')
         self.assembly_seqs.insert('1.0', example)
+        self.assembly_seqs.is_placeholder = False
         self.update_status("Example loaded")
     
     def find_overlaps(self):
         """UPDATED: Handle dictionary-based overlaps from new assembly.py"""
-        content = self.assembly_seqs.get('1.0', 'end-1c').strip()
-        if not content or "Paste sequences" in content:
-            messagebox.showwarning("Warning", "Please provide sequences")
+        sequences, min_ov = self._assembly_input("✗ Overlap analysis failed")
+        if sequences is None:
             return
         
-        try:
-            sequences = [s.strip().upper() for s in content.split('\n') if s.strip()]
-            if len(sequences) < 2:
-                messagebox.showwarning("Warning", "Please provide at least 2 sequences")
-                return
-            
-            min_ov = int(self.min_overlap.get())
-            self.update_status("Finding overlaps...")
-            
-            # ✅ NEW: overlaps is now a dictionary {(seq_a, seq_b): overlap_length}
-            overlaps = assembly.find_all_overlaps(sequences, min_ov)
-            stats = assembly.get_overlap_stats(overlaps, sequences)
-            
-            result = "=" * 60 + "\nOVERLAP ANALYSIS\n" + "=" * 60 + "\n\n"
-            result += f"Number of Sequences: {stats['num_sequences']}\n"
-            result += f"Minimum Overlap: {min_ov} bp\n"
-            result += f"Overlaps Found: {stats['num_overlaps']}\n"
-            result += f"Max Overlap Length: {stats['max_overlap_length']} bp\n"
-            result += f"Avg Overlap Length: {stats['avg_overlap_length']:.1f} bp\n\n"
-            
-            if overlaps:
-                result += "Overlap Table:\n"
-                result += assembly.format_overlap_table(overlaps)
-                result += "\n\nOverlap Visualization (top 5):\n"
-                
-                # ✅ NEW: Iterate over dictionary items, sorted by overlap length
-                count = 0
-                for (seq_a, seq_b), length in sorted(overlaps.items(), 
-                                                       key=lambda x: x[1], 
-                                                       reverse=True):
-                    if count >= 5:
-                        break
-                    result += assembly.visualize_overlap(seq_a, seq_b, length)
-                    result += "\n"
-                    count += 1
-                
-                if len(overlaps) > 5:
-                    result += f"... and {len(overlaps) - 5} more overlaps\n"
-            else:
-                result += "No overlaps found with minimum length requirement\n"
-            
-            self.assembly_results.config(state='normal')
-            self.assembly_results.delete('1.0', 'end')
-            self.assembly_results.insert('1.0', result)
-            self.assembly_results.config(state='disabled')
-            
-            self.update_status(f"✓ Found {len(overlaps)} overlaps")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            self.update_status("✗ Overlap analysis failed")
+        self.update_status("Finding overlaps...")
+        self.run_in_background(
+            self.overlaps_button,
+            lambda: self._overlap_report(sequences, min_ov),
+            lambda result: self.show_results(self.assembly_results, *result),
+            lambda e: self.show_error(str(e), "✗ Overlap analysis failed"),
+            key=('overlaps', content_key(*sequences, min_ov)))
     
-    def run_greedy_assembly(self):
-        content = self.assembly_seqs.get('1.0', 'end-1c').strip()
-        if not content or "Paste sequences" in content:
+    def _assembly_input(self, failed_status):
+        """Sequences (one per line) and minimum overlap from the assembly tab,
+        or (None, None) after warning about invalid input"""
+        sequences = self.sequence_lines(self.assembly_seqs)
+        if self.assembly_seqs.is_placeholder or not sequences:
             messagebox.showwarning("Warning", "Please provide sequences")
-            return
+            return None, None
+        
+        if len(sequences) < 2:
+            messagebox.showwarning("Warning", "Please provide at least 2 sequences")
+            return None, None
         
         try:
-            sequences = [s.strip().upper() for s in content.split('\n') if s.strip()]
-            if len(sequences) < 2:
-                messagebox.showwarning("Warning", "Please provide at least 2 sequences")
-                return
-            
-            min_ov = int(self.min_overlap.get())
-            self.update_status("Running greedy assembly...")
-            
-            contig, steps = assembly.greedy_assembly(sequences, min_ov)
-            
-            result = "=" * 60 + "\nGREEDY ASSEMBLY RESULTS\n" + "=" * 60 + "\n\n"
-            result += f"Input Sequences: {len(sequences)}\n"
-            result += f"Minimum Overlap: {min_ov} bp\n\n"
-            result += f"Final Contig:\nLength: {len(contig)} bp\nSequence: {contig}\n\n"
-            
-            total_input = sum(len(s) for s in sequences)
-            compression = ((total_input - len(contig)) / total_input * 100) if total_input > 0 else 0
-            result += f"Compression: {compression:.1f}%\n"
-            result += f"  (Input: {total_input} bp → Output: {len(contig)} bp)\n"
+            return sequences, int(self.min_overlap.get())
+        except ValueError as e:
+            self.show_error(str(e), failed_status)
+            return None, None
+    
+    def _overlap_report(self, sequences, min_ov):
+        """All overlaps of at least min_ov between sequences; returns (results text, status)"""
+        # overlaps is a dictionary {(i, j): overlap_length} of indices into sequences
+        overlaps = assembly.find_all_overlaps_indexed(sequences, min_ov)
+        stats = assembly.get_overlap_stats(overlaps, sequences)
+        
+        parts = ["=" * 60 + "\nOVERLAP ANALYSIS\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Number of Sequences: {stats['num_sequences']}\n")
+        parts.append(f"Minimum Overlap: {min_ov} bp\n")
+        parts.append(f"Overlaps Found: {stats['num_overlaps']}\n")
+        parts.append(f"Max Overlap Length: {stats['max_overlap_length']} bp\n")
+        parts.append(f"Avg Overlap Length: {stats['avg_overlap_length']:.1f} bp\n\n")
+        
+        if overlaps:
+            parts.append("Overlap Table:\n")
+            # Table lines go straight into parts instead of being joined
+            # into a second copy of the (possibly very long) table first
+            parts.extend(assembly.iter_overlap_table(overlaps, sequences))
+            parts.append("\n\nOverlap Visualization (top 5):\n")
             
-            self.assembly_results.config(state='normal')
-            self.assembly_results.delete('1.0', 'end')
-            self.assembly_results.insert('1.0', result)
-            self.assembly_results.config(state='disabled')
+            # Longest five only; nlargest keeps the same order (and tie
+            # order) as a full descending sort without sorting every pair
+            for (i, j), length in heapq.nlargest(5, overlaps.items(),
+                                                 key=lambda x: x[1]):
+                parts.append(assembly.visualize_overlap(sequences[i], sequences[j], length))
+                parts.append("\n")
             
-            self.update_status("✓ Assembly complete")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            self.update_status("✗ Assembly failed")
-    
-    # TAB 8: EDIT DISTANCE - NEW TAB (EMBEDDED FUNCTIONS)
-    def create_edit_distance_tab(self):
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="🧬 Edit Distance")
+            if len(overlaps) > 5:
+                parts.append(f"... and {len(overlaps) - 5} more overlaps\n")
+        else:
+            parts.append("No overlaps found with minimum length requirement\n")
         
-        tk.Label(tab, text="📁 Sequence X", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(20, 5))
+        return ''.join(parts), f"✓ Found {len(overlaps)} overlaps"
+    
+    def run_greedy_assembly(self):
+        sequences, min_ov = self._assembly_input("✗ Assembly failed")
+        if sequences is None:
+            return
         
-        tk.Button(tab, text="📝 Load Example", command=self.load_edit_distance_example,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=15, pady=8, cursor='hand2').pack(anchor='w', padx=20, pady=5)
+        self.update_status("Running greedy assembly...")
+        self.run_in_background(
+            self.assembly_button,
+            lambda: self._assembly_report(sequences, min_ov),
+            lambda result: self.show_results(self.assembly_results, *result),
+            lambda e: self.show_error(str(e), "✗ Assembly failed"),
+            key=('assembly', content_key(*sequences, min_ov)))
+    
+    def _assembly_report(self, sequences, min_ov):
+        """Greedy assembly of sequences; returns (results text, status)"""
+        contig, steps = assembly.greedy_assembly(sequences, min_ov, record_steps=False)
         
-        self.edit_seq_x = tk.Entry(tab, font=Fonts.TEXT, bg=Colors.INPUT_BG)
-        self.edit_seq_x.pack(fill='x', padx=20, pady=(5, 10))
-        self.edit_seq_x.insert(0, "ACGACGT")
+        parts = ["=" * 60 + "\nGREEDY ASSEMBLY RESULTS\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Input Sequences: {len(sequences)}\n")
+        parts.append(f"Minimum Overlap: {min_ov} bp\n\n")
+        parts.append(f"Final Contig:\nLength: {len(contig)} bp\nSequence: {contig}\n\n")
         
-        tk.Label(tab, text="📁 Sequence Y", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
+        total_input = sum(len(s) for s in sequences)
+        compression = ((total_input - len(contig)) / total_input * 100) if total_input > 0 else 0
+        parts.append(f"Compression: {compression:.1f}%\n")
+        parts.append(f"  (Input: {total_input} bp → Output: {len(contig)} bp)\n")
         
-        self.edit_seq_y = tk.Entry(tab, font=Fonts.TEXT, bg=Colors.INPUT_BG)
-        self.edit_seq_y.pack(fill='x', padx=20, pady=(5, 10))
-        self.edit_seq_y.insert(0, "TCGTACGT")
+        return ''.join(parts), "✓ Assembly complete"
+    
+    # TAB 8: EDIT DISTANCE - NEW TAB
+    def create_edit_distance_tab(self, tab):
+        self._heading(tab, "📁 Sequence X", pady=(20, 5))
+        self._button(tab, "📝 Load Example", self.load_edit_distance_example,
+                     padx=15, pady=8).pack(anchor='w', padx=20, pady=5)
+        self.edit_seq_x = self._entry(tab, "ACGACGT")
         
-        tk.Label(tab, text="⚙️ Options", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
+        self._heading(tab, "📁 Sequence Y")
+        self.edit_seq_y = self._entry(tab, "TCGTACGT")
         
-        options_frame = tk.Frame(tab, bg=Colors.WHITE)
-        options_frame.pack(anchor='w', padx=20, pady=5)
+        self._heading(tab, "⚙️ Options")
+        options_frame = self._row(tab, pady=5)
         
         self.show_matrix = tk.BooleanVar(value=True)
         tk.Checkbutton(options_frame, text="Show DP Matrix", variable=self.show_matrix,
@@ -977,23 +1020,14 @@ GCTAGCTAGCTAGCTAG"""
         tk.Checkbutton(options_frame, text="Show Alignment", variable=self.show_alignment,
                       bg=Colors.WHITE, font=Fonts.LABEL).pack(side='left')
         
-        action_frame = tk.Frame(tab, bg=Colors.WHITE)
-        action_frame.pack(anchor='w', padx=20, pady=10)
-        
-        tk.Button(action_frame, text="⚡ Calculate Distance", command=self.calculate_edit_distance,
-                  bg=Colors.SECONDARY, fg='white', font=Fonts.BUTTON,
-                  relief='flat', padx=20, pady=10, cursor='hand2').pack(side='left', padx=(0, 10))
-        
-        tk.Button(action_frame, text="🗑️ Clear", command=self.clear_edit_distance_tab,
-                  bg=Colors.WHITE, fg=Colors.TEXT_DARK, font=Fonts.BUTTON,
-                  relief='solid', bd=1, padx=20, pady=10, cursor='hand2').pack(side='left')
+        action_frame = self._row(tab)
+        self.edit_run_button = self._button(action_frame, "⚡ Calculate Distance",
+                                            self.calculate_edit_distance)
+        self.edit_run_button.pack(side='left', padx=(0, 10))
+        self._button(action_frame, "🗑️ Clear", self.clear_edit_distance_tab,
+                     style='Ghost.TButton').pack(side='left')
         
-        tk.Label(tab, text="📊 Results", font=Fonts.HEADING,
-                 bg=Colors.WHITE, fg=Colors.PRIMARY).pack(anchor='w', padx=20, pady=(10, 5))
-        
-        self.edit_results = scrolledtext.ScrolledText(tab, height=15, font=('Courier', 9),
-                                                       bg=Colors.OUTPUT_BG, wrap='none', state='disabled')
-        self.edit_results.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        self.edit_results = self._results_box(tab, 15, font=('Courier', 9))
     
     def load_edit_distance_example(self):
         self.edit_seq_x.delete(0, 'end')
@@ -1011,69 +1045,78 @@ GCTAGCTAGCTAGCTAG"""
             return
         
         # Validate DNA sequences
-        valid_chars = set('ACGT')
-        if not all(c in valid_chars for c in x):
+        if not is_dna(x):
             messagebox.showwarning("Input Error", "Sequence X contains invalid characters. Use only A, C, G, T.")
             return
         
-        if not all(c in valid_chars for c in y):
+        if not is_dna(y):
             messagebox.showwarning("Input Error", "Sequence Y contains invalid characters. Use only A, C, G, T.")
             return
         
-        try:
-            self.update_status("Calculating edit distance...")
-            
-            # Calculate edit distance and get matrix - USING EMBEDDED FUNCTIONS
-            distance, matrix = edit_distance_with_matrix(x, y)
-            
-            # Build result
-            result = "=" * 60 + "\nEDIT DISTANCE ANALYSIS\n" + "=" * 60 + "\n\n"
-            result += f"Sequence X: {x} (length: {len(x)})\n"
-            result += f"Sequence Y: {y} (length: {len(y)})\n\n"
-            result += "=" * 60 + "\n"
-            result += f"EDIT DISTANCE: {int(distance)}\n"
-            result += "=" * 60 + "\n\n"
-            
-            # Show DP matrix if requested
-            if self.show_matrix.get():
-                result += "DYNAMIC PROGRAMMING MATRIX:\n"
-                result += "-" * 60 + "\n"
-                result += format_edit_distance_matrix(matrix, x, y)
-                result += "\n\n"
-            
-            # Show alignment if requested
-            if self.show_alignment.get():
-                aligned_x, aligned_y, operations = traceback_alignment(x, y, matrix)
-                result += "=" * 60 + "\n"
-                result += format_alignment(aligned_x, aligned_y, operations)
-                result += "\n" + "=" * 60 + "\n"
-            
-            self.edit_results.config(state='normal')
-            self.edit_results.delete('1.0', 'end')
-            self.edit_results.insert('1.0', result)
-            self.edit_results.config(state='disabled')
-            
-            self.update_status(f"✓ Edit distance: {int(distance)}")
-            messagebox.showinfo("Success", f"Edit distance calculated: {int(distance)}")
-        
-        except Exception as e:
-            messagebox.showerror("Error", f"Calculation failed:\n{str(e)}")
-            self.update_status("✗ Calculation failed")
+        show_matrix = self.show_matrix.get()
+        show_alignment = self.show_alignment.get()
+        self.update_status("Calculating edit distance...")
+        self.run_in_background(
+            self.edit_run_button,
+            lambda: self._edit_distance_report(x, y, show_matrix, show_alignment),
+            self._edit_distance_done,
+            lambda e: self.show_error(f"Calculation failed:\n{str(e)}", "✗ Calculation failed"),
+            key=('edit', content_key(x, y, show_matrix, show_alignment)))
+    
+    def _edit_distance_report(self, x, y, show_matrix, show_alignment):
+        """Edit distance of x and y; returns (results text, distance)"""
+        if show_matrix:
+            # Calculate edit distance and get matrix
+            distance, matrix = edit.edit_distance_with_matrix(x, y)
+        else:
+            # The two-row DP gives the distance without allocating the
+            # (len(x)+1) x (len(y)+1) matrix
+            distance = edit.edit_distance_DP(x, y)
+        
+        # Build result
+        parts = ["=" * 60 + "\nEDIT DISTANCE ANALYSIS\n" + "=" * 60 + "\n\n"]
+        parts.append(f"Sequence X: {x} (length: {len(x)})\n")
+        parts.append(f"Sequence Y: {y} (length: {len(y)})\n\n")
+        parts.append("=" * 60 + "\n")
+        parts.append(f"EDIT DISTANCE: {int(distance)}\n")
+        parts.append("=" * 60 + "\n\n")
+        
+        # Show DP matrix if requested
+        if show_matrix:
+            parts.append("DYNAMIC PROGRAMMING MATRIX:\n")
+            parts.append("-" * 60 + "\n")
+            parts.append(edit.format_matrix(matrix, x, y))
+            parts.append("\n\n")
+        
+        # Show alignment if requested
+        if show_alignment:
+            if show_matrix:
+                aligned_x, aligned_y, operations = edit.traceback_alignment(x, y, matrix)
+            else:
+                # Linear memory for long inputs; small ones still get
+                # the matrix traceback inside hirschberg_alignment
+                aligned_x, aligned_y, operations = edit.hirschberg_alignment(x, y)
+            parts.append("=" * 60 + "\n")
+            parts.append(edit.format_alignment(aligned_x, aligned_y, operations))
+            parts.append("\n" + "=" * 60 + "\n")
+        
+        return ''.join(parts), int(distance)
+    
+    def _edit_distance_done(self, result):
+        text, distance = result
+        self.show_results(self.edit_results, text, f"✓ Edit distance: {distance}")
+        messagebox.showinfo("Success", f"Edit distance calculated: {distance}")
     
     def clear_edit_distance_tab(self):
         self.edit_seq_x.delete(0, 'end')
         self.edit_seq_y.delete(0, 'end')
-        self.edit_results.config(state='normal')
-        self.edit_results.delete('1.0', 'end')
-        self.edit_results.config(state='disabled')
+        self.clear_output(self.edit_results)
         self.update_status("Cleared")
     
     # UTILITY
     def clear_tab(self, input_widget, output_widget):
         input_widget.delete('1.0', 'end')
-        output_widget.config(state='normal')
-        output_widget.delete('1.0', 'end')
-        output_widget.config(state='disabled')
+        self.clear_output(output_widget)
         self.update_status("Cleared")
 
 
@@ -1081,7 +1124,14 @@ def main():
     root = tk.Tk()
     app = BioAnalyzerApp(root)
     root.mainloop()
+    # Drop queued jobs instead of finishing them after the window is gone
+    # (cancelled one by one: shutdown's cancel_futures needs Python 3.9)
+    for future in list(app._jobs):
+        future.cancel()
+    app._pool.shutdown(wait=False)
 
 
 if __name__ == "__main__":
+    # Needed so overlap search worker processes start in the frozen .exe
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -3,9 +3,22 @@ Quick Fix Script - BioAnalyzer Pro
 Fixes common issues and installs missing dependencies
 """
 
+import importlib.util
+import py_compile
 import subprocess
 import sys
 import os
+try:
+    from importlib.metadata import version, PackageNotFoundError
+except ImportError:  # Python 3.7 - use the backport if present, else find_spec
+    try:
+        from importlib_metadata import version, PackageNotFoundError
+    except ImportError:
+        version = None
+
+# Import name of each package whose distribution name differs, for the
+# find_spec fallback
+IMPORT_NAMES = {"pillow": "PIL"}
 
 def print_banner():
     print("\n" + "=" * 60)
@@ -25,22 +38,58 @@ def install_pillow():
         return False
 
 
+def is_installed(package):
+    """True if the distribution is already installed (no pip subprocess)"""
+    if version is None:
+        return importlib.util.find_spec(IMPORT_NAMES.get(package, package)) is not None
+    try:
+        version(package)
+        return True
+    except PackageNotFoundError:
+        return False
+
+
 def install_all_dependencies():
     """Install all required packages"""
     print("📦 Installing all dependencies...")
     packages = ["pillow", "pandas", "numpy"]
     
+    missing = [package for package in packages if not is_installed(package)]
     for package in packages:
-        print(f"  Installing {package}...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"  ✓ {package} installed\n")
-        except:
-            print(f"  ✗ Failed to install {package}\n")
+        if package not in missing:
+            print(f"  ✓ {package} already installed")
+    if not missing:
+        print("\n✅ All dependencies installed!\n")
+        return
+    
+    # One pip run resolves and installs everything that is missing
+    print(f"  Installing {', '.join(missing)}...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+        print(f"  ✓ {', '.join(missing)} installed\n")
+    except Exception:
+        print(f"  ✗ Failed to install {', '.join(missing)}\n")
+        return
     
     print("✅ All dependencies installed!\n")
 
 
+def bytecode_is_fresh(path):
+    """True if path's cached .pyc was compiled from its current source
+    (the same magic/mtime/size check the import system makes)"""
+    try:
+        st = os.stat(path)
+        with open(importlib.util.cache_from_source(path), 'rb') as f:
+            header = f.read(16)
+    except OSError:
+        return False
+    return (len(header) == 16
+            and header[:4] == importlib.util.MAGIC_NUMBER
+            and int.from_bytes(header[4:8], 'little') == 0  # timestamp-based pyc
+            and int.from_bytes(header[8:12], 'little') == int(st.st_mtime) & 0xFFFFFFFF
+            and int.from_bytes(header[12:16], 'little') == st.st_size & 0xFFFFFFFF)
+
+
 def check_syntax():
     """Check if main.py has syntax errors"""
     print("🔍 Checking main.py for syntax errors...")
@@ -49,17 +98,33 @@ def check_syntax():
         print("  ⚠️  main.py not found!")
         return False
     
-    try:
-        with open('main.py', 'r', encoding='utf-8') as f:
-            code = f.read()
-            compile(code, 'main.py', 'exec')
-        print("  ✓ No syntax errors found\n")
+    # A .pyc is only written for source that compiled, so an up-to-date
+    # one means main.py has not changed since it last passed
+    if bytecode_is_fresh('main.py'):
+        print("  ✓ No syntax errors found (unchanged since last check)\n")
         return True
-    except SyntaxError as e:
-        print(f"  ✗ Syntax error found: {e}\n")
-        print("  Line:", e.lineno)
-        print("  Text:", e.text)
-        return False
+    
+    try:
+        py_compile.compile('main.py', doraise=True)
+    except py_compile.PyCompileError as e:
+        return report_syntax_error(e.exc_value)
+    except OSError:
+        # The .pyc could not be written (read-only folder): check in memory
+        try:
+            with open('main.py', 'rb') as f:
+                compile(f.read(), 'main.py', 'exec')
+        except SyntaxError as e:
+            return report_syntax_error(e)
+    print("  ✓ No syntax errors found\n")
+    return True
+
+
+def report_syntax_error(error):
+    """Print where main.py failed to compile; returns False for check_syntax"""
+    print(f"  ✗ Syntax error found: {error}\n")
+    print("  Line:", getattr(error, 'lineno', None))
+    print("  Text:", getattr(error, 'text', None))
+    return False
 
 
 def main():
@@ -4,15 +4,48 @@ UI Styles configuration
 
 from tkinter import ttk
 
+from config import Colors, Fonts
+
+# style.configure options per style name
+STYLE_CONFIG = {
+    'TNotebook': {'background': '#F8F9FA'},
+    'TNotebook.Tab': {'padding': [20, 10], 'font': ('Helvetica', 10)},
+    'TFrame': {'background': '#FFFFFF'},
+    # Button styles: configured once here instead of per-button options
+    # Filled buttons (main actions)
+    'Primary.TButton': {'background': Colors.SECONDARY, 'foreground': 'white',
+                        'font': Fonts.BUTTON, 'relief': 'flat', 'borderwidth': 0},
+    'Accent.TButton': {'background': Colors.ACCENT, 'foreground': 'white',
+                       'font': Fonts.BUTTON, 'relief': 'flat', 'borderwidth': 0},
+    # White bordered buttons (Clear, secondary actions)
+    'Ghost.TButton': {'background': Colors.WHITE, 'foreground': Colors.TEXT_DARK,
+                      'font': Fonts.BUTTON, 'relief': 'solid', 'borderwidth': 1,
+                      'bordercolor': Colors.TEXT_DARK},
+    'Highlight.Ghost.TButton': {'foreground': Colors.SECONDARY},
+}
+
+# style.map state-dependent options per style name
+STYLE_MAP = {
+    'Primary.TButton': {'background': [('disabled', Colors.TEXT_LIGHT), ('active', Colors.PRIMARY)]},
+    'Accent.TButton': {'background': [('disabled', Colors.TEXT_LIGHT), ('active', Colors.SECONDARY)]},
+    'Ghost.TButton': {'background': [('active', Colors.BACKGROUND)]},
+}
+
+# Tk root whose styles are already configured; styles live in the Tcl
+# interpreter, so a second call for the same root has nothing to do
+_styled_root = None
+
 
 def setup_styles():
-    """Setup TTK styles"""
+    """Setup TTK styles (once per Tk root)"""
+    global _styled_root
     style = ttk.Style()
+    if _styled_root is not None and style.master is _styled_root:
+        return
+    _styled_root = style.master
     style.theme_use('clam')
     
-    # Configure Notebook style
-    style.configure('TNotebook', background='#F8F9FA')
-    style.configure('TNotebook.Tab', padding=[20, 10], font=('Helvetica', 10))
-    
-    # Configure Frame style
-    style.configure('TFrame', background='#FFFFFF')
\ No newline at end of file
+    for name, options in STYLE_CONFIG.items():
+        style.configure(name, **options)
+    for name, states in STYLE_MAP.items():
+        style.map(name, **states)
@@ -0,0 +1,47 @@
+"""
+Input widgets with placeholder text
+"""
+
+import tkinter as tk
+from tkinter import scrolledtext
+
+
+class _Placeholder:
+    """
+    Shows a hint until the widget is first focused or typed into
+    
+    is_placeholder tells handlers whether the text is still the hint,
+    without searching the input for it; code that fills the widget itself
+    (examples, uploads) sets it to False
+    """
+    
+    START = '1.0'
+    
+    def _show_placeholder(self, placeholder):
+        self.insert(self.START, placeholder)
+        self.is_placeholder = True
+        self.bind('<FocusIn>', self._clear_placeholder, add='+')
+        self.bind('<KeyPress>', self._clear_placeholder, add='+')
+    
+    def _clear_placeholder(self, event=None):
+        if self.is_placeholder:
+            self.is_placeholder = False
+            self.delete(self.START, 'end')
+
+
+class PlaceholderText(_Placeholder, scrolledtext.ScrolledText):
+    """ScrolledText with placeholder text"""
+    
+    def __init__(self, master=None, placeholder='', **kw):
+        super().__init__(master, **kw)
+        self._show_placeholder(placeholder)
+
+
+class PlaceholderEntry(_Placeholder, tk.Entry):
+    """Entry with placeholder text"""
+    
+    START = 0
+    
+    def __init__(self, master=None, placeholder='', **kw):
+        super().__init__(master, **kw)
+        self._show_placeholder(placeholder)